@@ -12,72 +12,214 @@ How it works:
 """
 
 import os
+import re
+import mmap
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
+import httpx
 from dotenv import load_dotenv
 from openai import OpenAI
 
+# hnswlib is optional: it adds a fast approximate search for large collections
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
 # Load environment variables from .env file
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client.
+# One shared HTTP client keeps connections open between requests, so
+# repeated calls skip the connection and TLS setup.
+http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=60.0
+)
+client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+
+# Files at least this big (1 MB) are read through a memory map
+MMAP_MIN_BYTES = 1024 * 1024
+
+# A "word" is any run of non-whitespace characters
+WORD_PATTERN = re.compile(r"\S+")
+
+# Embedding model and how many chunks to send per API request
+EMBEDDING_MODEL = "text-embedding-ada-002"
+EMBEDDING_DIM = 1536
+EMBEDDING_BATCH_SIZE = 256
+
+# File that stores embeddings we've already paid for, so re-runs are free
+EMBEDDING_CACHE_FILE = "embedding_cache.sqlite"
+
+# Memory-mapped matrix holding one normalized embedding per chunk, and a
+# fingerprint of the chunks it was built from (to reuse it on the next run)
+EMBEDDINGS_FILE = "chunk_embeddings.npy"
+EMBEDDINGS_FINGERPRINT_FILE = "chunk_embeddings.sha256"
+
+# Saved HNSW graph for the same chunks, and the fingerprint it was built for
+HNSW_INDEX_FILE = "chunk_embeddings.hnsw"
+HNSW_FINGERPRINT_FILE = "chunk_embeddings.hnsw.sha256"
+
+# Saved int8 copy of the embeddings, its per-row scales, and the
+# fingerprint they were built for
+QUANTIZED_FILE = "chunk_embeddings.int8.npy"
+QUANTIZED_SCALES_FILE = "chunk_embeddings.scales.npy"
+QUANTIZED_FINGERPRINT_FILE = "chunk_embeddings.int8.sha256"
+
+# With this many chunks or more, the Numba top-k search (if installed) wins
+NUMBA_MIN_CHUNKS = 100_000
+
+# With this many chunks or more, search an int8 copy of the embeddings
+# (4x less memory traffic), scanning it a block of rows at a time
+QUANTIZE_MIN_CHUNKS = 20_000
+QUANTIZED_BLOCK_ROWS = 512
+
+# With more chunks than this, build an HNSW graph (if hnswlib is installed)
+# so a question only visits a small part of the collection
+HNSW_MIN_CHUNKS = 2000
+
+# Groups our chat requests for server-side prompt caching
+PROMPT_CACHE_KEY = "rag_app_v1"
+
+# How many past questions to remember, and how similar a new question must
+# be to a past one (cosine similarity) to reuse that question's answer
+QUESTION_CACHE_SIZE = 256
+SIMILAR_QUESTION_THRESHOLD = 0.97
+
+# Recently asked questions and their embeddings (oldest first)
+question_embeddings = OrderedDict()
+
+
+def read_text_file(path):
+    """
+    Read a UTF-8 text file.
+    
+    Large files are memory-mapped and decoded straight from the mapping,
+    which avoids an extra copy of the raw bytes.
+    
+    Args:
+        path: Path to the file
+    
+    Returns:
+        File contents as a string
+    """
+    if os.path.getsize(path) >= MMAP_MIN_BYTES:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, 'utf-8')
+        # Text mode (below) turns Windows and old Mac line endings into
+        # "\n", so do the same here to get identical chunks either way
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
 
 
 def load_documents(folder_path="documents"):
     """
     Load all text documents from the specified folder.
     
+    Files are read in parallel threads, so waiting on the disk for one
+    file overlaps with reading the others.
+    
     Args:
         folder_path: Path to the folder containing .txt files
     
     Returns:
-        List of tuples (filename, content)
+        List of tuples (filename, content), sorted by filename
     """
-    documents = []
     doc_folder = Path(folder_path)
     
     # Create folder if it doesn't exist
     doc_folder.mkdir(exist_ok=True)
     
-    # Read all .txt files
-    for file_path in doc_folder.glob("*.txt"):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            documents.append((file_path.name, content))
+    # Find all .txt files
+    with os.scandir(doc_folder) as entries:
+        files = sorted(
+            (entry.name, entry.path) for entry in entries
+            if entry.is_file() and entry.name.endswith('.txt')
+        )
+    
+    if not files:
+        return []
     
-    return documents
+    # Read them all at once
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        contents = list(executor.map(read_text_file, [path for _, path in files]))
+    
+    return [(name, content) for (name, _), content in zip(files, contents)]
 
 
 def split_into_chunks(text, chunk_size=500):
     """
     Split text into smaller chunks for better processing.
     
+    Walks over the words with a single regular expression. Instead of
+    building chunk strings, it yields where each chunk starts and ends,
+    so the caller can slice text[start:end] only when it needs the chunk.
+    
     Args:
         text: The text to split
         chunk_size: Approximate size of each chunk in characters
     
-    Returns:
-        List of text chunks
+    Yields:
+        (start, end) character positions of each chunk in text
     """
-    words = text.split()
-    chunks = []
-    current_chunk = []
+    chunk_start = None
+    chunk_end = 0
     current_size = 0
     
-    for word in words:
-        current_chunk.append(word)
-        current_size += len(word) + 1  # +1 for space
+    for match in WORD_PATTERN.finditer(text):
+        if chunk_start is None:
+            chunk_start = match.start()
+        chunk_end = match.end()
+        current_size += chunk_end - match.start() + 1  # +1 for space
         
         if current_size >= chunk_size:
-            chunks.append(' '.join(current_chunk))
-            current_chunk = []
+            yield chunk_start, chunk_end
+            chunk_start = None
             current_size = 0
     
     # Add remaining words
-    if current_chunk:
-        chunks.append(' '.join(current_chunk))
+    if chunk_start is not None:
+        yield chunk_start, chunk_end
+
+
+def open_embedding_cache(path=EMBEDDING_CACHE_FILE):
+    """
+    Open (or create) the on-disk embedding cache.
+    
+    Args:
+        path: Path to the SQLite cache file
+    
+    Returns:
+        sqlite3 connection to the cache
+    """
+    cache = sqlite3.connect(path)
+    cache.execute(
+        "CREATE TABLE IF NOT EXISTS cache ("
+        "hash TEXT PRIMARY KEY, model TEXT, dim INT, vec BLOB)"
+    )
+    return cache
+
+
+def embedding_cache_key(text, model=EMBEDDING_MODEL):
+    """
+    Build the cache key for a piece of text.
+    
+    Args:
+        text: The text that will be embedded
+        model: Embedding model name (different models give different vectors)
     
-    return chunks
+    Returns:
+        Hex SHA-256 digest of the model and text
+    """
+    return hashlib.sha256(f"{model}|{text}".encode("utf-8")).hexdigest()
 
 
 def create_embedding(text):
@@ -88,59 +230,465 @@ def create_embedding(text):
         text: Text to convert to embedding
     
     Returns:
-        Embedding vector (list of numbers)
+        Embedding vector (numpy array of float32)
     """
-    response = client.embeddings.create(
-        model="text-embedding-ada-002",
-        input=text
+    return create_embeddings([text])[0]
+
+
+def get_question_embedding(question):
+    """
+    Get the embedding for a question, reusing it if it was asked recently.
+    
+    Args:
+        question: The user's question
+    
+    Returns:
+        Normalized embedding vector (numpy array of float32)
+    """
+    if question in question_embeddings:
+        question_embeddings.move_to_end(question)
+        return question_embeddings[question]
+    
+    embedding = normalize(create_embedding(question))
+    question_embeddings[question] = embedding
+    
+    # Forget the least recently used question once the cache is full
+    if len(question_embeddings) > QUESTION_CACHE_SIZE:
+        question_embeddings.popitem(last=False)
+    
+    return embedding
+
+
+def create_embeddings(texts, cache=None, out=None, batch_size=EMBEDDING_BATCH_SIZE):
+    """
+    Create embeddings for many texts using as few API calls as possible.
+    
+    The embeddings endpoint accepts a list of inputs, so instead of one
+    request per chunk we send the chunks in batches. This is much faster
+    than embedding them one at a time.
+    
+    If a cache is given, texts that were embedded before (in this run or a
+    previous one) are read from disk and never sent to the API.
+    
+    Each vector is written straight into one row of a float32 matrix, which
+    takes about 7x less memory than keeping Python lists of floats.
+    
+    Args:
+        texts: List of texts to convert to embeddings
+        cache: Optional connection from open_embedding_cache()
+        out: Optional (len(texts) x EMBEDDING_DIM) float32 array to fill,
+             e.g. a memory-mapped .npy file
+        batch_size: Maximum number of texts sent in a single request
+    
+    Returns:
+        float32 numpy array with one embedding per row, in the same order as texts
+    """
+    if out is None:
+        out = np.empty((len(texts), EMBEDDING_DIM), dtype=np.float32)
+    
+    # Group rows by text, so each distinct text is looked up and embedded once
+    rows_by_key = {}
+    for row, text in enumerate(texts):
+        rows_by_key.setdefault(embedding_cache_key(text), []).append(row)
+    
+    # Fill in everything we already have in the cache
+    missing_keys = []
+    for key, rows in rows_by_key.items():
+        cached = None
+        if cache is not None:
+            cached = cache.execute("SELECT vec FROM cache WHERE hash = ?", (key,)).fetchone()
+        if cached is not None:
+            out[rows] = np.frombuffer(cached[0], dtype=np.float32)
+        else:
+            missing_keys.append(key)
+    
+    for start in range(0, len(missing_keys), batch_size):
+        batch_keys = missing_keys[start:start + batch_size]
+        response = client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=[texts[rows_by_key[key][0]] for key in batch_keys]
+        )
+        # The API returns one result per input, tagged with its position
+        for item in response.data:
+            key = batch_keys[item.index]
+            vector = np.asarray(item.embedding, dtype=np.float32)
+            out[rows_by_key[key]] = vector
+            if cache is not None:
+                # Store raw float32 bytes: 4x smaller and faster than JSON
+                cache.execute(
+                    "INSERT OR REPLACE INTO cache (hash, model, dim, vec) VALUES (?, ?, ?, ?)",
+                    (key, EMBEDDING_MODEL, len(vector), vector.tobytes())
+                )
+        if cache is not None:
+            cache.commit()
+    
+    return out
+
+
+def normalize(vector):
+    """
+    Scale a vector to length 1.
+    
+    For vectors of length 1, the dot product equals the cosine similarity.
+    
+    Args:
+        vector: 1-D numpy array
+    
+    Returns:
+        New float32 numpy array with length 1
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / (np.linalg.norm(vector) + 1e-12)
+
+
+def normalize_rows(matrix):
+    """
+    Scale every row of a matrix to length 1, in place.
+    
+    This is done once when the index is built, so searching never has to
+    divide by vector lengths.
+    
+    Args:
+        matrix: float32 matrix with one embedding per row (modified in place)
+    """
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1e-12)
+
+
+def chunks_fingerprint(chunks):
+    """
+    Make a short fingerprint that changes whenever any chunk changes.
+    
+    Args:
+        chunks: List of text chunks
+    
+    Returns:
+        Hex string (SHA-256 of every chunk's cache key, in order)
+    """
+    return hashlib.sha256(
+        "".join(embedding_cache_key(chunk) for chunk in chunks).encode("utf-8")
+    ).hexdigest()
+
+
+def load_chunk_embeddings(chunks, fingerprint=None):
+    """
+    Get the normalized embedding matrix for the chunks.
+    
+    The finished matrix is saved in EMBEDDINGS_FILE together with a
+    fingerprint of the chunks. If the documents haven't changed since the
+    last run, the saved matrix is simply mapped from disk, skipping both
+    the embedding cache and the normalization step.
+    
+    Args:
+        chunks: List of text chunks
+        fingerprint: chunks_fingerprint(chunks), if already computed
+    
+    Returns:
+        float32 matrix (memory-mapped .npy file) with one row per chunk
+    """
+    if fingerprint is None:
+        fingerprint = chunks_fingerprint(chunks)
+    fingerprint_file = Path(EMBEDDINGS_FINGERPRINT_FILE)
+    
+    if (Path(EMBEDDINGS_FILE).exists() and fingerprint_file.exists()
+            and fingerprint_file.read_text() == fingerprint):
+        embeddings = np.load(EMBEDDINGS_FILE, mmap_mode="r")
+        # Only trust the file if it has exactly one row per chunk
+        if embeddings.shape == (len(chunks), EMBEDDING_DIM):
+            return embeddings
+    
+    # Remove the old fingerprint before overwriting the matrix. If this
+    # rebuild fails partway, the half-written file then won't match any
+    # fingerprint, and the next run rebuilds it instead of using it.
+    fingerprint_file.unlink(missing_ok=True)
+    
+    # Embed every chunk in a few batched requests, reusing cached results.
+    # The vectors go into a float32 .npy file mapped into memory.
+    embeddings = np.lib.format.open_memmap(
+        EMBEDDINGS_FILE,
+        mode="w+",
+        dtype=np.float32,
+        shape=(len(chunks), EMBEDDING_DIM)
     )
-    return response.data[0].embedding
+    cache = open_embedding_cache()
+    create_embeddings(chunks, cache=cache, out=embeddings)
+    cache.close()
+    
+    normalize_rows(embeddings)
+    embeddings.flush()
+    fingerprint_file.write_text(fingerprint)
+    
+    return embeddings
+
+
+def quantize_embeddings(matrix, fingerprint=None):
+    """
+    Compress embeddings to 8-bit integers (int8), one scale per row.
+    
+    Each row is stored as small whole numbers between -127 and 127 plus a
+    single float "scale", so that row ~= quantized_row * scale. This uses
+    4x less memory than float32 and barely changes the similarity ranking.
+    
+    The rows are converted a block at a time, so no full-size float32
+    temporary is ever created. When a fingerprint is given, the result is
+    written to QUANTIZED_FILE and QUANTIZED_SCALES_FILE and simply mapped
+    from disk on the next run with the same chunks.
+    
+    Args:
+        matrix: float32 matrix with one embedding per row
+        fingerprint: chunks_fingerprint() of the chunks, or None to keep
+                     the result in memory without saving it
+    
+    Returns:
+        Tuple (quantized, scales): int8 matrix and float32 scale per row
+    """
+    fingerprint_file = Path(QUANTIZED_FINGERPRINT_FILE)
+    
+    if (fingerprint is not None and Path(QUANTIZED_FILE).exists()
+            and Path(QUANTIZED_SCALES_FILE).exists()
+            and fingerprint_file.exists() and fingerprint_file.read_text() == fingerprint):
+        quantized = np.load(QUANTIZED_FILE, mmap_mode="r")
+        scales = np.load(QUANTIZED_SCALES_FILE)
+        # Only trust the files if they have exactly one row per chunk
+        if quantized.shape == matrix.shape and scales.shape == (len(matrix),):
+            return quantized, scales
+    
+    if fingerprint is not None:
+        # Same order as load_chunk_embeddings: the fingerprint is only
+        # written once both files are complete
+        fingerprint_file.unlink(missing_ok=True)
+        quantized = np.lib.format.open_memmap(
+            QUANTIZED_FILE, mode="w+", dtype=np.int8, shape=matrix.shape
+        )
+    else:
+        quantized = np.empty(matrix.shape, dtype=np.int8)
+    scales = np.empty(len(matrix), dtype=np.float32)
+    
+    for start in range(0, len(matrix), QUANTIZED_BLOCK_ROWS):
+        block = np.asarray(matrix[start:start + QUANTIZED_BLOCK_ROWS], dtype=np.float32)
+        block_scales = (np.abs(block).max(axis=1) / 127.0).clip(min=1e-12)
+        scales[start:start + QUANTIZED_BLOCK_ROWS] = block_scales
+        quantized[start:start + QUANTIZED_BLOCK_ROWS] = np.round(block / block_scales[:, None])
+    
+    if fingerprint is not None:
+        quantized.flush()
+        np.save(QUANTIZED_SCALES_FILE, scales)
+        fingerprint_file.write_text(fingerprint)
+    
+    return quantized, scales
+
+
+def build_hnsw_index(matrix, fingerprint=None):
+    """
+    Build an HNSW graph for approximate nearest-neighbor search.
+    
+    HNSW links each embedding to a few similar ones. A search walks
+    this graph towards the question instead of comparing it with every
+    chunk, so it stays fast even with millions of chunks.
+    
+    Building the graph is slow, so when a fingerprint is given the graph
+    is saved in HNSW_INDEX_FILE and simply loaded on the next run with
+    the same chunks.
+    
+    Args:
+        matrix: float32 matrix with one normalized embedding per row
+        fingerprint: chunks_fingerprint() of the chunks, or None to
+                     always build a fresh graph without saving it
+    
+    Returns:
+        hnswlib.Index ready for knn_query()
+    """
+    hnsw = hnswlib.Index(space='ip', dim=matrix.shape[1])
+    fingerprint_file = Path(HNSW_FINGERPRINT_FILE)
+    
+    if (fingerprint is not None and Path(HNSW_INDEX_FILE).exists()
+            and fingerprint_file.exists() and fingerprint_file.read_text() == fingerprint):
+        hnsw.load_index(HNSW_INDEX_FILE, max_elements=len(matrix))
+        if hnsw.get_current_count() == len(matrix):
+            return hnsw
+        hnsw = hnswlib.Index(space='ip', dim=matrix.shape[1])
+    
+    hnsw.init_index(max_elements=len(matrix), ef_construction=200, M=16)
+    hnsw.add_items(matrix, np.arange(len(matrix)))
+    
+    if fingerprint is not None:
+        # Same order as load_chunk_embeddings: the fingerprint is only
+        # written once the saved graph is complete
+        fingerprint_file.unlink(missing_ok=True)
+        hnsw.save_index(HNSW_INDEX_FILE)
+        fingerprint_file.write_text(fingerprint)
+    
+    return hnsw
+
+
+def build_search_index(chunks, embeddings, quantize=None, use_hnsw=None, fingerprint=None):
+    """
+    Pack the chunks and their embeddings into a searchable index.
+    
+    All embeddings are stacked into one (chunks x dimensions) float32
+    matrix, so scoring every chunk against a question becomes a single
+    fast matrix-vector product instead of a Python loop.
+    
+    Args:
+        chunks: List of text chunks
+        embeddings: Normalized embedding matrix with one row per chunk
+                    (see load_chunk_embeddings)
+        quantize: Also keep an int8 copy for searching. None means only
+                  when there are at least QUANTIZE_MIN_CHUNKS chunks and
+                  no HNSW graph will answer the questions instead.
+        use_hnsw: Also build an HNSW graph. None means only when hnswlib
+                  is installed and there are more than HNSW_MIN_CHUNKS chunks.
+        fingerprint: chunks_fingerprint(chunks), to save the int8 copy and
+                     the HNSW graph and reuse them on the next run
+                     (see quantize_embeddings and build_hnsw_index)
+    
+    Returns:
+        Dictionary with the chunk texts and the embedding matrix
+    """
+    index = {
+        'texts': list(chunks),
+        # No copy when embeddings is already a float32 matrix (or memmap)
+        'matrix': np.asarray(embeddings, dtype=np.float32)
+    }
+    
+    if use_hnsw is None:
+        use_hnsw = hnswlib is not None and len(index['texts']) > HNSW_MIN_CHUNKS
+    
+    # The int8 copy only speeds up the exact search, which isn't used
+    # when the HNSW graph answers the questions
+    if quantize is None:
+        quantize = not use_hnsw and len(index['texts']) >= QUANTIZE_MIN_CHUNKS
+    
+    if quantize:
+        index['quantized'], index['scales'] = quantize_embeddings(index['matrix'], fingerprint)
+    
+    if use_hnsw:
+        index['hnsw'] = build_hnsw_index(index['matrix'], fingerprint)
+    
+    return index
+
+
+def score_chunks(index, question_embedding, backend="auto"):
+    """
+    Compute the similarity of every chunk to the question.
+    
+    With an int8 index, the matrix is read in small blocks that are
+    converted to float32 while they are still in the CPU cache, so only
+    a quarter of the bytes come from main memory.
+    
+    The "numba" backend uses the compiled multi-core scan from
+    rag_app_numba.py instead of NumPy's matrix product, which helps on
+    systems where NumPy has no fast BLAS library.
+    
+    Args:
+        index: Search index from build_search_index()
+        question_embedding: float32 embedding of the question
+        backend: "auto", "numpy" or "numba"
+    
+    Returns:
+        float32 numpy array with one score per chunk
+    """
+    matrix = index.get('quantized', index['matrix'])
+    
+    use_numba = False
+    if backend == "numba":
+        # Numba is slow to import, so it's only loaded when asked for
+        from rag_app_numba import NUMBA_AVAILABLE, scan
+        use_numba = NUMBA_AVAILABLE
+    
+    if use_numba:
+        scores = np.empty(len(matrix), dtype=np.float32)
+        scan(np.asarray(matrix), question_embedding, scores)
+    elif 'quantized' in index:
+        scores = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), QUANTIZED_BLOCK_ROWS):
+            block = matrix[start:start + QUANTIZED_BLOCK_ROWS].astype(np.float32)
+            scores[start:start + QUANTIZED_BLOCK_ROWS] = block @ question_embedding
+    else:
+        return matrix @ question_embedding
+    
+    if 'quantized' in index:
+        # Undo the per-row scaling applied by quantize_embeddings()
+        scores *= index['scales']
+    return scores
 
 
-def cosine_similarity(vec1, vec2):
+def top_k_indices(scores, top_k, backend="auto"):
     """
-    Calculate similarity between two vectors.
+    Find the positions of the highest scores, best first.
+    
+    The "numpy" backend uses np.argpartition to pick the top_k items
+    without sorting everything, then sorts only those few items. The
+    "numba" backend does a single pass with a small heap, which is faster
+    for very large collections. "auto" picks Numba when it is installed
+    and there are at least NUMBA_MIN_CHUNKS scores.
     
     Args:
-        vec1, vec2: Embedding vectors to compare
+        scores: 1-D numpy array of similarity scores
+        top_k: Number of positions to return
+        backend: "auto", "numpy" or "numba"
     
     Returns:
-        Similarity score (higher = more similar)
+        numpy array of indices into scores
     """
-    # Simple dot product (works well for normalized embeddings)
-    return sum(a * b for a, b in zip(vec1, vec2))
+    top_k = min(top_k, len(scores))
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64)
+    
+    if backend == "auto":
+        backend = "numba" if len(scores) >= NUMBA_MIN_CHUNKS else "numpy"
+    
+    if backend == "numba":
+        # Numba is slow to import, so it's only loaded for large collections
+        from rag_app_numba import NUMBA_AVAILABLE, topk_heap
+        if NUMBA_AVAILABLE:
+            return topk_heap(scores.astype(np.float32, copy=False), top_k)
+    
+    if top_k < len(scores):
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        best = np.arange(len(scores))
+    
+    return best[np.argsort(-scores[best])]
 
 
-def find_relevant_chunks(question, chunks_with_embeddings, top_k=3):
+def find_relevant_chunks(question_embedding, index, top_k=3, backend="auto"):
     """
     Find the most relevant chunks for a question.
     
     Args:
-        question: The user's question
-        chunks_with_embeddings: List of (chunk, embedding) tuples
+        question_embedding: Embedding of the user's question (see create_embedding)
+        index: Search index from build_search_index()
         top_k: Number of relevant chunks to return
+        backend: "auto" (use the HNSW graph if the index has one),
+                 or force an exact search with "numpy" or "numba"
     
     Returns:
         List of most relevant chunks
     """
-    # Get embedding for the question
-    question_embedding = create_embedding(question)
+    question_embedding = normalize(question_embedding)
+    top_k = min(top_k, len(index['texts']))
+    
+    if backend == "auto" and 'hnsw' in index:
+        # Approximate search: only visits a small part of the collection
+        index['hnsw'].set_ef(max(50, top_k))
+        labels, _ = index['hnsw'].knn_query(question_embedding, k=top_k)
+        return [index['texts'][i] for i in labels[0]]
     
-    # Calculate similarity for each chunk
-    similarities = []
-    for chunk, chunk_embedding in chunks_with_embeddings:
-        similarity = cosine_similarity(question_embedding, chunk_embedding)
-        similarities.append((chunk, similarity))
+    # Score every chunk at once. Both sides are normalized,
+    # so the dot product is the cosine similarity.
+    scores = score_chunks(index, question_embedding, backend=backend)
     
-    # Sort by similarity and get top results
-    similarities.sort(key=lambda x: x[1], reverse=True)
-    return [chunk for chunk, _ in similarities[:top_k]]
+    best = top_k_indices(scores, top_k, backend=backend)
+    return [index['texts'][i] for i in best]
 
 
 def generate_answer(question, context_chunks):
     """
     Generate an answer using AI based on relevant context.
     
+    The answer is streamed: each piece is printed as soon as it arrives,
+    so you can start reading before the whole answer is ready.
+    
     Args:
         question: The user's question
         context_chunks: Relevant text chunks to use as context
@@ -162,18 +710,71 @@ Question: {question}
 
 Answer:"""
     
-    # Get response from AI
-    response = client.chat.completions.create(
+    # Get response from AI, printing it piece by piece.
+    # The fixed instructions come before the context and question, so that
+    # shared prefix can be reused through the server's prompt cache.
+    stream = client.chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[
             {"role": "system", "content": "You are a helpful assistant that answers questions based on the provided context."},
             {"role": "user", "content": prompt}
         ],
         temperature=0.7,
-        max_tokens=500
+        max_tokens=500,
+        stream=True,
+        extra_body={"prompt_cache_key": PROMPT_CACHE_KEY}
     )
     
-    return response.choices[0].message.content
+    parts = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            print(delta, end="", flush=True)
+            parts.append(delta)
+    print()
+    
+    return "".join(parts)
+
+
+def find_cached_answer(question_embedding, answer_cache):
+    """
+    Look for an earlier question that means the same thing as this one.
+    
+    Args:
+        question_embedding: Embedding of the new question
+        answer_cache: Dictionary with 'embeddings' and 'answers' lists
+    
+    Returns:
+        The earlier answer, or None if no past question is similar enough
+    """
+    if not answer_cache['answers']:
+        return None
+    
+    similarities = np.stack(answer_cache['embeddings']) @ question_embedding
+    best = int(np.argmax(similarities))
+    if similarities[best] > SIMILAR_QUESTION_THRESHOLD:
+        return answer_cache['answers'][best]
+    return None
+
+
+def remember_answer(question_embedding, answer, answer_cache):
+    """
+    Store an answer so very similar questions can reuse it.
+    
+    Args:
+        question_embedding: Embedding of the question that was answered
+        answer: The generated answer
+        answer_cache: Dictionary with 'embeddings' and 'answers' lists
+    """
+    answer_cache['embeddings'].append(question_embedding)
+    answer_cache['answers'].append(answer)
+    
+    # Keep only the most recent answers
+    if len(answer_cache['answers']) > QUESTION_CACHE_SIZE:
+        del answer_cache['embeddings'][0]
+        del answer_cache['answers'][0]
 
 
 def main():
@@ -201,15 +802,19 @@ def main():
     
     # Step 2: Split documents into chunks and create embeddings
     print("Processing documents and creating embeddings...")
-    all_chunks_with_embeddings = []
-    
+    all_chunks = []
     for filename, content in documents:
-        chunks = split_into_chunks(content)
-        for chunk in chunks:
-            embedding = create_embedding(chunk)
-            all_chunks_with_embeddings.append((chunk, embedding))
+        all_chunks.extend(content[start:end] for start, end in split_into_chunks(content))
+    
+    if not all_chunks:
+        print("The documents are empty. Please add some text and try again.")
+        return
     
-    print(f"Created {len(all_chunks_with_embeddings)} chunks")
+    fingerprint = chunks_fingerprint(all_chunks)
+    all_embeddings = load_chunk_embeddings(all_chunks, fingerprint)
+    index = build_search_index(all_chunks, all_embeddings, fingerprint=fingerprint)
+    
+    print(f"Created {len(index['texts'])} chunks")
     print()
     
     # Step 3: Interactive question-answering loop
@@ -217,32 +822,51 @@ def main():
     print("-" * 60)
     print()
     
-    while True:
-        # Get user question
-        question = input("Your question: ").strip()
-        
-        if question.lower() in ['quit', 'exit', 'q']:
-            print("Goodbye!")
-            break
-        
-        if not question:
-            continue
-        
-        print()
-        print("Thinking...")
-        
-        # Find relevant chunks
-        relevant_chunks = find_relevant_chunks(question, all_chunks_with_embeddings)
-        
-        # Generate answer
-        answer = generate_answer(question, relevant_chunks)
-        
-        print()
-        print("Answer:")
-        print(answer)
-        print()
-        print("-" * 60)
-        print()
+    # Answers to earlier questions, so repeated questions are answered instantly
+    answer_cache = {'embeddings': [], 'answers': []}
+    
+    # A background thread fetches question embeddings, so the request
+    # starts the moment a question is entered
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            # Get user question
+            question = input("Your question: ").strip()
+            
+            if question.lower() in ['quit', 'exit', 'q']:
+                print("Goodbye!")
+                break
+            
+            if not question:
+                continue
+            
+            embedding_future = executor.submit(get_question_embedding, question)
+            
+            print()
+            print("Thinking...")
+            question_embedding = embedding_future.result()
+            
+            # Reuse the answer to an earlier question that means the same thing
+            cached_answer = find_cached_answer(question_embedding, answer_cache)
+            if cached_answer is not None:
+                print()
+                print("Answer (from a similar earlier question):")
+                print(cached_answer)
+                print()
+                print("-" * 60)
+                print()
+                continue
+            
+            # Find relevant chunks
+            relevant_chunks = find_relevant_chunks(question_embedding, index)
+            
+            # Generate answer (printed while it streams in)
+            print()
+            print("Answer:")
+            answer = generate_answer(question, relevant_chunks)
+            remember_answer(question_embedding, answer, answer_cache)
+            print()
+            print("-" * 60)
+            print()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+"""
+Optional Numba Kernels for the RAG App
+======================================
+Speed-ups for searching very large document collections.
+
+Numba compiles these small Python functions to machine code the first
+time they run. It is optional: if it isn't installed, NUMBA_AVAILABLE is
+False and rag_app.py uses its plain NumPy code instead.
+
+Install with:
+    pip install numba
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator that leaves the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def scan(matrix, query, out):
+    """
+    Compute the dot product of every row of matrix with query.
+
+    Rows are split across all CPU cores (prange), and the inner loop is
+    compiled to SIMD instructions. Works for float32 and int8 matrices.
+
+    Args:
+        matrix: 2-D numpy array with one embedding per row
+        query: 1-D float32 numpy array
+        out: 1-D float32 numpy array that receives one score per row
+    """
+    for i in prange(matrix.shape[0]):
+        total = 0.0
+        for j in range(matrix.shape[1]):
+            total += matrix[i, j] * query[j]
+        out[i] = total
+
+
+@njit(cache=True)
+def topk_heap(scores, k):
+    """
+    Find the positions of the k highest scores, best first.
+
+    Keeps a small min-heap of the best k scores seen so far, so each of
+    the N scores is looked at once and nothing else is sorted.
+
+    Args:
+        scores: 1-D float32 numpy array of similarity scores
+        k: Number of positions to return (must be <= len(scores))
+
+    Returns:
+        int64 numpy array of indices into scores
+    """
+    heap_scores = np.empty(k, np.float32)
+    heap_ids = np.empty(k, np.int64)
+    size = 0
+
+    for i in range(scores.shape[0]):
+        score = scores[i]
+
+        if size < k:
+            # Heap not full yet: add at the bottom and sift up
+            pos = size
+            size += 1
+            while pos > 0:
+                parent = (pos - 1) // 2
+                if heap_scores[parent] <= score:
+                    break
+                heap_scores[pos] = heap_scores[parent]
+                heap_ids[pos] = heap_ids[parent]
+                pos = parent
+            heap_scores[pos] = score
+            heap_ids[pos] = i
+        elif score > heap_scores[0]:
+            # Better than the worst kept score: replace the root and sift down
+            pos = 0
+            while True:
+                child = 2 * pos + 1
+                if child >= k:
+                    break
+                if child + 1 < k and heap_scores[child + 1] < heap_scores[child]:
+                    child += 1
+                if heap_scores[child] >= score:
+                    break
+                heap_scores[pos] = heap_scores[child]
+                heap_ids[pos] = heap_ids[child]
+                pos = child
+            heap_scores[pos] = score
+            heap_ids[pos] = i
+
+    # Sort the k survivors from best to worst
+    order = np.argsort(-heap_scores)
+    return heap_ids[order]
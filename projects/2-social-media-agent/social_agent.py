@@ -12,15 +12,28 @@ Key Features:
 """
 
 import os
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import httpx
 from dotenv import load_dotenv
 from openai import OpenAI
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client.
+# One shared HTTP client keeps connections open between requests, so
+# repeated calls skip the connection and TLS setup.
+http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=60.0
+)
+client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+
+# File where approved posts are saved (opened once, see get_posts_file)
+APPROVED_POSTS_FILE = "approved_posts.txt"
+posts_file = None
 
 
 def generate_social_post(topic, style="casual", max_length=280):
@@ -113,6 +126,23 @@ Be strict but fair."""
         return False, [result]
 
 
+def get_posts_file():
+    """
+    Get the approved posts file, opening it the first time it's needed.
+    
+    The file stays open for the whole session (and is closed when the
+    program exits) instead of being reopened for every post.
+    
+    Returns:
+        File object opened for appending
+    """
+    global posts_file
+    if posts_file is None:
+        posts_file = open(APPROVED_POSTS_FILE, "a", encoding="utf-8", buffering=8192)
+        atexit.register(posts_file.close)
+    return posts_file
+
+
 def save_approved_post(post_text, topic):
     """
     Save an approved post to a file.
@@ -123,11 +153,15 @@ def save_approved_post(post_text, topic):
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    with open("approved_posts.txt", "a", encoding="utf-8") as f:
-        f.write(f"\n{'='*60}\n")
-        f.write(f"Timestamp: {timestamp}\n")
-        f.write(f"Topic: {topic}\n")
-        f.write(f"Post:\n{post_text}\n")
+    f = get_posts_file()
+    f.write(
+        f"\n{'='*60}\n"
+        f"Timestamp: {timestamp}\n"
+        f"Topic: {topic}\n"
+        f"Post:\n{post_text}\n"
+    )
+    # Make sure the post is on disk right away
+    f.flush()
 
 
 def get_style_choice():
@@ -164,91 +198,94 @@ def main():
     print("You'll review and approve each post before saving.")
     print()
     
-    while True:
-        print("-" * 60)
-        
-        # Get topic from user
-        topic = input("\nEnter a topic for your post (or 'quit' to exit): ").strip()
-        
-        if topic.lower() in ['quit', 'exit', 'q']:
-            print("\nGoodbye!")
-            break
-        
-        if not topic:
-            continue
-        
-        # Get style preference
-        style = get_style_choice()
-        
-        print("\n🤖 Generating post...")
-        
-        # Generate the post
-        try:
-            post = generate_social_post(topic, style)
-        except Exception as e:
-        # Loop to allow regenerating new versions with same topic and style
+    # Background worker for the safety check
+    with ThreadPoolExecutor(max_workers=1) as executor:
         while True:
-            print("\n🤖 Generating post...")
-            
-            # Generate the post
-            try:
-                post = generate_social_post(topic, style)
-            except Exception as e:
-                print(f"\n❌ Error generating post: {e}")
-                break
+            print("-" * 60)
             
-            # Show the generated post
-            print("\n" + "="*60)
-            print("GENERATED POST:")
-            print("="*60)
-            print(post)
-            print("="*60)
-            print(f"\nCharacter count: {len(post)}")
+            # Get topic from user
+            topic = input("\nEnter a topic for your post (or 'quit' to exit): ").strip()
             
-            # AI content review
-            print("\n🔍 Running safety check...")
-            is_safe, issues = review_post(post)
+            if topic.lower() in ['quit', 'exit', 'q']:
+                print("\nGoodbye!")
+                break
             
-            if not is_safe:
-                print("\n⚠️  SAFETY CONCERNS DETECTED:")
-                for issue in issues:
-                    print(f"  - {issue}")
-                print("\nThis post may need revision.")
-            else:
-                print("✅ Safety check passed")
+            if not topic:
+                continue
             
-            # Get user approval
-            print("\n" + "-"*60)
-            print("Do you approve this post?")
-            print("1. Approve and save")
-            print("2. Reject (discard)")
-            print("3. Generate a new version")
+            # Get style preference
+            style = get_style_choice()
             
+            # Loop to allow regenerating new versions with same topic and style
             while True:
-                decision = input("\nEnter 1-3: ").strip()
+                print("\n🤖 Generating post...")
                 
-                if decision == "1":
-                    # Approve and save
-                    save_approved_post(post, topic)
-                    print("\n✅ Post approved and saved to approved_posts.txt")
-                    break
-                elif decision == "2":
-                    # Reject
-                    print("\n🗑️  Post rejected and discarded")
-                    break
-                elif decision == "3":
-                    # Generate new version
-                    print("\n🤖 Generating new version...")
+                # Generate the post
+                try:
+                    post = generate_social_post(topic, style)
+                except Exception as e:
+                    print(f"\n❌ Error generating post: {e}")
                     break
+                
+                # Start the safety check in the background right away,
+                # so it runs while the post is being shown
+                review_future = executor.submit(review_post, post)
+                
+                # Show the generated post
+                print("\n" + "="*60)
+                print("GENERATED POST:")
+                print("="*60)
+                print(post)
+                print("="*60)
+                print(f"\nCharacter count: {len(post)}")
+                
+                # AI content review
+                print("\n🔍 Running safety check...")
+                try:
+                    is_safe, issues = review_future.result()
+                except Exception as e:
+                    is_safe, issues = False, [f"Safety check failed: {e}"]
+                
+                if not is_safe:
+                    print("\n⚠️  SAFETY CONCERNS DETECTED:")
+                    for issue in issues:
+                        print(f"  - {issue}")
+                    print("\nThis post may need revision.")
                 else:
-                    print("Invalid choice. Please enter 1-3.")
-            
-            # If user chose to generate a new version, repeat inner loop
-            if decision == "3":
-                continue
-            
-            # For approve or reject, go back to outer loop for a new topic
-            break
+                    print("✅ Safety check passed")
+                
+                # Get user approval
+                print("\n" + "-"*60)
+                print("Do you approve this post?")
+                print("1. Approve and save")
+                print("2. Reject (discard)")
+                print("3. Generate a new version")
+                
+                while True:
+                    decision = input("\nEnter 1-3: ").strip()
+                    
+                    if decision == "1":
+                        # Approve and save
+                        save_approved_post(post, topic)
+                        print("\n✅ Post approved and saved to approved_posts.txt")
+                        break
+                    elif decision == "2":
+                        # Reject
+                        print("\n🗑️  Post rejected and discarded")
+                        break
+                    elif decision == "3":
+                        # Generate new version
+                        print("\n🤖 Generating new version...")
+                        break
+                    else:
+                        print("Invalid choice. Please enter 1-3.")
+                
+                # If user chose to generate a new version, repeat inner loop
+                if decision == "3":
+                    continue
+                
+                # For approve or reject, go back to outer loop for a new topic
+                break
 
 
 if __name__ == "__main__":
@@ -14,7 +14,12 @@ DISCLAIMER: This is for educational purposes only. Not financial advice.
 """
 
 import os
+import re
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import httpx
 from dotenv import load_dotenv
 from openai import OpenAI
 import yfinance as yf
@@ -22,48 +27,195 @@ import yfinance as yf
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client.
+# One shared HTTP client keeps connections open between requests, so
+# repeated calls skip the connection and TLS setup.
+http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=60.0
+)
+client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+
+# Recently fetched stock data: symbol -> (time fetched, data)
+STOCK_CACHE_TTL = 60  # seconds
+STOCK_CACHE_SIZE = 128
+stock_cache = {}
+stock_cache_lock = threading.Lock()  # several threads may fetch at once
+
+# Company names we've already looked up: symbol -> name
+company_names = {}
+company_names_lock = threading.Lock()
+
+# Names are downloaded in the background by a few shared threads, so
+# asking about many symbols never starts more than this many at once
+NAME_LOOKUP_WORKERS = 4
+name_lookup_executor = ThreadPoolExecutor(max_workers=NAME_LOOKUP_WORKERS)
+
+# Most stocks to show for a single question, and most words to try as symbols
+MAX_SYMBOLS = 5
+MAX_CANDIDATES = 10
+
+# Common stock symbols (you can expand this).
+# A frozenset makes "is this a known symbol?" a single fast lookup.
+KNOWN_SYMBOLS = frozenset({
+    'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'TSLA', 'META',
+    'NVDA', 'AMD', 'INTC', 'NFLX', 'DIS', 'BA', 'GE', 'IBM'
+})
+
+# Everyday words that look like ticker symbols.
+# They are skipped unless they are in KNOWN_SYMBOLS. Some of them are also
+# real tickers (A, ALL, IT, LOW, NOW, ON, ...), but a question like "Is AAPL
+# up or down today?" would otherwise look up UP and DOWN too. To ask about
+# one of these on purpose, write it with a dollar sign (e.g., "$LOW").
+COMMON_WORDS = frozenset({
+    'A', 'AN', 'THE', 'AND', 'OR', 'BUT', 'IF', 'SO', 'AS', 'AT', 'BY',
+    'FOR', 'FROM', 'IN', 'OF', 'ON', 'TO', 'WITH', 'ABOUT', 'THAN', 'THEN',
+    'I', 'ME', 'MY', 'WE', 'US', 'YOU', 'YOUR', 'IT', 'ITS', 'THEY', 'THEM',
+    'THIS', 'THAT', 'THESE', 'THOSE', 'IS', 'ARE', 'WAS', 'BE', 'BEEN',
+    'DO', 'DOES', 'DID', 'HAS', 'HAVE', 'HAD', 'CAN', 'COULD', 'WOULD',
+    'WILL', 'GET', 'GIVE', 'SHOW', 'TELL', 'WHAT', 'WHATS', 'HOW', 'WHY',
+    'WHO', 'WHEN', 'WHERE', 'WHICH', 'NOT', 'NO', 'YES', 'ANY', 'SOME',
+    'ALL', 'MUCH', 'MANY', 'MORE', 'VS', 'NOW', 'TODAY', 'DAY', 'WEEK',
+    'MONTH', 'YEAR', 'LAST', 'NEXT', 'GOING', 'DOING', 'PRICE', 'STOCK',
+    'SHARE', 'VALUE', 'TRADE', 'CHART', 'NEWS', 'TREND', 'HIGH', 'LOW',
+    'UP', 'DOWN', 'OPEN', 'CLOSE', 'BUY', 'SELL', 'GOOD', 'BAD', 'LIKE'
+})
+
+# Matches each whitespace-separated word without leading/trailing
+# punctuation, brackets or quotes (so "(MSFT)" gives MSFT)
+WORD_PATTERN = re.compile(r"(?<!\S)[.,!?;:()\"']*(\S+?)[.,!?;:()\"']*(?!\S)")
+
+
+def number_or_zero(value):
+    """
+    Turn a missing number (None or NaN) into 0.
+    
+    Args:
+        value: Number from yfinance, possibly missing
+    
+    Returns:
+        The number, or 0 if it was missing
+    """
+    if value is None or value != value:  # NaN is the only value not equal to itself
+        return 0
+    return value
+
+
+def get_company_name(symbol):
+    """
+    Get a company's display name without slowing down the price lookup.
+    
+    The full name needs yfinance's slow .info download, so the first time
+    a symbol is seen the name is fetched in the background (by
+    name_lookup_executor). Until it arrives, the ticker symbol is used as
+    the name.
+    
+    Args:
+        symbol: Stock ticker symbol in upper case (e.g., 'AAPL')
+    
+    Returns:
+        Company name, or the ticker symbol if the name isn't known yet
+    """
+    with company_names_lock:
+        if symbol not in company_names:
+            # Use the symbol until the real name arrives (this also makes
+            # sure each name is only looked up once)
+            company_names[symbol] = symbol
+            name_lookup_executor.submit(look_up_company_name, symbol)
+        return company_names[symbol]
+
+
+def look_up_company_name(symbol):
+    """
+    Download a company's full name and remember it (runs in the background).
+    
+    Args:
+        symbol: Stock ticker symbol in upper case (e.g., 'AAPL')
+    """
+    try:
+        name = yf.Ticker(symbol).info.get('longName')
+    except Exception:
+        return
+    
+    if name:
+        with company_names_lock:
+            company_names[symbol] = name
 
 
 def get_stock_data(symbol):
     """
     Fetch stock data for a given symbol.
     
+    Results are kept for STOCK_CACHE_TTL seconds, so asking about the same
+    stock again right away doesn't download everything again.
+    
     Args:
         symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
     
+    Returns:
+        Dictionary with stock information, or None if error
+    """
+    symbol = symbol.upper()
+    
+    # Reuse recent data for this symbol if we have it
+    with stock_cache_lock:
+        cached = stock_cache.get(symbol)
+    if cached and time.monotonic() - cached[0] < STOCK_CACHE_TTL:
+        return cached[1]
+    
+    data = fetch_stock_data(symbol)
+    
+    if data is not None:
+        with stock_cache_lock:
+            # Forget the oldest entry when the cache is full
+            if symbol not in stock_cache and len(stock_cache) >= STOCK_CACHE_SIZE:
+                stock_cache.pop(next(iter(stock_cache)))
+            stock_cache[symbol] = (time.monotonic(), data)
+    
+    return data
+
+
+def fetch_stock_data(symbol):
+    """
+    Download stock data for a given symbol from Yahoo Finance.
+    
+    Uses yfinance's lightweight fast_info for the prices instead of the
+    much slower full .info lookup. The company name is fetched separately,
+    in the background, and added when the summary is built (see
+    create_stock_summary), so cached data never keeps a placeholder name.
+    
+    Args:
+        symbol: Stock ticker symbol in upper case (e.g., 'AAPL')
+    
     Returns:
         Dictionary with stock information, or None if error
     """
     try:
         # Create ticker object
-        ticker = yf.Ticker(symbol.upper())
-        
-        # Get current info
-        info = ticker.info
+        ticker = yf.Ticker(symbol)
         
-        # Get today's data
-        hist = ticker.history(period="1d")
+        # Get current prices
+        info = ticker.fast_info
+        current_price = number_or_zero(info.last_price)
         
-        if hist.empty:
+        if not current_price:
             return None
         
-        current_price = hist['Close'].iloc[-1]
+        # Start looking up the company name while we work on the prices
+        get_company_name(symbol)
         
         # Prepare data dictionary
         data = {
-            'symbol': symbol.upper(),
-            'name': info.get('longName', symbol.upper()),
+            'symbol': symbol,
             'current_price': round(current_price, 2),
-            'previous_close': info.get('previousClose', 0),
-            'open': info.get('open', 0),
-            'day_high': info.get('dayHigh', 0),
-            'day_low': info.get('dayLow', 0),
-            'volume': info.get('volume', 0),
-            'market_cap': info.get('marketCap', 0),
-            '52_week_high': info.get('fiftyTwoWeekHigh', 0),
-            '52_week_low': info.get('fiftyTwoWeekLow', 0),
+            'previous_close': round(number_or_zero(info.previous_close), 2),
+            'open': round(number_or_zero(info.open), 2),
+            'day_high': round(number_or_zero(info.day_high), 2),
+            'day_low': round(number_or_zero(info.day_low), 2),
+            'volume': int(number_or_zero(info.last_volume)),
+            'market_cap': number_or_zero(info.market_cap),
+            '52_week_high': round(number_or_zero(info.year_high), 2),
+            '52_week_low': round(number_or_zero(info.year_low), 2),
         }
         
         # Calculate change
@@ -107,14 +259,23 @@ def create_stock_summary(data):
     """
     Create a text summary of stock data.
     
+    The company name is read here rather than stored with the prices, so
+    it shows up as soon as the background lookup has finished.
+    
     Args:
         data: Stock data dictionary
     
     Returns:
         Formatted summary string
     """
+    name = get_company_name(data['symbol'])
+    if name == data['symbol']:
+        title = data['symbol']
+    else:
+        title = f"{name} ({data['symbol']})"
+    
     summary = f"""
-Stock: {data['name']} ({data['symbol']})
+Stock: {title}
 Current Price: ${data['current_price']}
 Change: ${data['change']} ({data['change_percent']:+.2f}%)
 Previous Close: ${data['previous_close']}
@@ -134,18 +295,41 @@ Market Cap: {format_large_number(data['market_cap'])}
     return summary
 
 
-def explain_with_ai(stock_data, user_question):
+def get_many_stocks(symbols):
+    """
+    Fetch stock data for several symbols at the same time.
+    
+    Each download mostly waits on the network, so running them in
+    parallel threads takes about as long as fetching a single stock.
+    
+    Args:
+        symbols: List of stock ticker symbols
+    
+    Returns:
+        List of stock data dictionaries (same order as symbols; None for
+        symbols that couldn't be fetched)
+    """
+    if not symbols:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as executor:
+        return list(executor.map(get_stock_data, symbols))
+
+
+def explain_with_ai(stocks, user_question):
     """
     Use AI to explain stock data in simple terms.
     
+    All stocks go into one prompt, so a single AI request covers them all.
+    
     Args:
-        stock_data: Stock information
+        stocks: List of stock data dictionaries
         user_question: The user's original question
     
     Returns:
         AI-generated explanation
     """
-    summary = create_stock_summary(stock_data)
+    summary = "\n".join(create_stock_summary(stock_data) for stock_data in stocks)
     
     prompt = f"""The user asked: "{user_question}"
 
@@ -182,25 +366,21 @@ def extract_symbols(text):
         text: User's question
     
     Returns:
-        List of potential stock symbols
+        List of potential stock symbols (without repeats)
     """
-    # Simple extraction - look for uppercase words or known patterns
-    words = text.upper().split()
-    
-    # Common stock symbols (you can expand this)
-    known_symbols = [
-        'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'TSLA', 'META', 
-        'NVDA', 'AMD', 'INTC', 'NFLX', 'DIS', 'BA', 'GE', 'IBM'
-    ]
+    # Simple extraction - look at each word, ignoring surrounding punctuation
+    words = WORD_PATTERN.findall(text.upper())
     
     symbols = []
     for word in words:
-        # Remove common punctuation
-        clean_word = word.strip('.,!?;:')
-        if clean_word in known_symbols or (len(clean_word) <= 5 and clean_word.isalpha()):
-            symbols.append(clean_word)
-    
-    return symbols if symbols else []
+        # "$LOW" always means a ticker, even if it's also a common word
+        if word.startswith('$') and 1 < len(word) <= 6 and word[1:].isalpha():
+            symbols.append(word[1:])
+        elif word in KNOWN_SYMBOLS or (
+            len(word) <= 5 and word.isalpha() and word not in COMMON_WORDS
+        ):
+            symbols.append(word)
+    return list(dict.fromkeys(symbols))
 
 
 def main():
@@ -217,6 +397,7 @@ def main():
     print("  - 'What's the price of AAPL?'")
     print("  - 'How is TSLA doing today?'")
     print("  - 'Tell me about Microsoft stock (MSFT)'")
+    print("  - 'Compare $LOW and HD' (use $ for tickers that are also words)")
     print()
     
     while True:
@@ -225,6 +406,8 @@ def main():
         
         if question.lower() in ['quit', 'exit', 'q']:
             print("\nGoodbye! Happy learning!")
+            # Don't wait for name lookups that haven't started yet
+            name_lookup_executor.shutdown(wait=False, cancel_futures=True)
             break
         
         if not question:
@@ -236,25 +419,31 @@ def main():
         if not symbols:
             print("\n❓ I couldn't find a stock symbol in your question.")
             print("Please include a ticker symbol (e.g., AAPL, TSLA, MSFT)")
+            print("Tickers that are also words need a $ sign (e.g., $LOW, $ALL)")
             continue
         
-        # For now, use the first symbol found
-        symbol = symbols[0]
+        symbols = symbols[:MAX_CANDIDATES]
         
-        print(f"\n🔍 Fetching data for {symbol}...")
+        print(f"\n🔍 Fetching data for {', '.join(symbols)}...")
         
-        # Get stock data
-        stock_data = get_stock_data(symbol)
+        # Try every candidate at once, then keep the first MAX_SYMBOLS that
+        # turn out to be real stocks
+        stocks = []
+        for symbol, stock_data in zip(symbols, get_many_stocks(symbols)):
+            if stock_data:
+                stocks.append(stock_data)
+            else:
+                print(f"\n❌ Couldn't find data for {symbol}")
+        stocks = stocks[:MAX_SYMBOLS]
         
-        if not stock_data:
-            print(f"\n❌ Couldn't find data for {symbol}")
+        if not stocks:
             print("Make sure you're using a valid stock ticker symbol.")
             continue
         
         # Get AI explanation
         print("\n💭 Analyzing...")
         try:
-            explanation = explain_with_ai(stock_data, question)
+            explanation = explain_with_ai(stocks, question)
         except Exception as e:
             print("\n❌ There was a problem getting an AI explanation.")
             print("This might be due to a network issue, rate limit, or API key problem.")
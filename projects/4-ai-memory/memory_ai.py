@@ -13,45 +13,113 @@ Key Features:
 
 import os
 import json
+from collections import deque
 from pathlib import Path
+import httpx
 from dotenv import load_dotenv
 from openai import OpenAI
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client.
+# One shared HTTP client keeps connections open between requests, so
+# repeated calls skip the connection and TLS setup.
+http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=60.0
+)
+client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
 
-# File to store conversation history
-HISTORY_FILE = "conversation_history.json"
+# File to store conversation history (one JSON message per line)
+HISTORY_FILE = "conversation_history.jsonl"
+
+# Older versions saved the whole history as one JSON list in this file
+LEGACY_HISTORY_FILE = "conversation_history.json"
+
+# Maximum number of messages sent to the AI each turn (including the system message)
+MAX_MESSAGES = 20
+
+# Groups our requests for server-side prompt caching
+PROMPT_CACHE_KEY = "memory_ai_v1"
+
+# Instructions sent at the start of every conversation.
+# Keep this text identical between turns (no timestamps) so it can be cached.
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful AI assistant with memory. You remember previous parts of the conversation and can reference them. Be friendly, helpful, and maintain context."
+}
+
+
+def migrate_legacy_history():
+    """
+    Move history saved by older versions into HISTORY_FILE.
+    
+    The old file's messages are added to the end of HISTORY_FILE (without
+    the system message, which is now sent separately) and the old file is
+    removed, so this only happens once.
+    """
+    legacy_file = Path(LEGACY_HISTORY_FILE)
+    if not legacy_file.exists():
+        return
+    
+    try:
+        with open(legacy_file, 'r', encoding='utf-8') as f:
+            legacy_history = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        # Leave the file alone so nothing is lost
+        print(f"⚠️ Couldn't read {LEGACY_HISTORY_FILE}: {e}")
+        return
+    
+    append_messages([msg for msg in legacy_history if msg.get('role') != 'system'])
+    legacy_file.unlink()
 
 
 def load_conversation_history():
     """
     Load conversation history from file.
     
+    History saved by older versions is moved over first
+    (see migrate_legacy_history).
+    
     Returns:
         List of message dictionaries
     """
+    migrate_legacy_history()
+    
+    history = []
     if Path(HISTORY_FILE).exists():
         try:
             with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        history.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # Skip a damaged line (e.g. the app was killed mid-write)
+                        continue
+        except IOError:
             return []
-    return []
+    return history
 
 
-def save_conversation_history(history):
+def append_messages(new_messages):
     """
-    Save conversation history to file.
+    Add new messages to the end of the history file.
+    
+    Only the new messages are written, so saving takes the same time
+    no matter how long the conversation gets.
     
     Args:
-        history: List of message dictionaries
+        new_messages: List of message dictionaries not yet saved
     """
-    with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(history, f, indent=2, ensure_ascii=False)
+    if not new_messages:
+        return
+    
+    with open(HISTORY_FILE, 'a', encoding='utf-8') as f:
+        for message in new_messages:
+            f.write(json.dumps(message, ensure_ascii=False) + "\n")
 
 
 def clear_conversation_history():
@@ -91,63 +159,73 @@ def display_memory(history):
     print("="*60 + "\n")
 
 
-def trim_history(history, max_messages=20):
+def create_history_window(messages=(), max_messages=MAX_MESSAGES):
     """
     Keep only recent messages to manage token usage.
     
+    Returns a deque with a fixed maximum length: once it is full, adding a
+    new message automatically drops the oldest one. The system message is
+    kept separately (see SYSTEM_MESSAGE), so one slot is reserved for it.
+    
     Args:
-        history: Full conversation history
-        max_messages: Maximum number of messages to keep
+        messages: Messages to start with (e.g. loaded from file)
+        max_messages: Maximum number of messages sent to the AI, including
+                      the system message
     
     Returns:
-        Trimmed history
+        collections.deque holding the most recent messages
     """
-    if len(history) <= max_messages:
-        return history
-    
-    # Keep system message if present, plus recent messages
-    if history and history[0]['role'] == 'system':
-        return [history[0]] + history[-(max_messages-1):]
-    else:
-        return history[-max_messages:]
+    return deque(
+        (msg for msg in messages if msg['role'] != 'system'),
+        maxlen=max_messages - 1
+    )
 
 
 def chat_with_memory(user_message, conversation_history):
     """
     Send a message and get a response with memory.
     
+    The response is streamed: each piece is printed as soon as it arrives.
+    
     Args:
         user_message: The user's message
-        conversation_history: Previous conversation
+        conversation_history: Recent conversation from create_history_window()
     
     Returns:
         AI's response
     """
-    # Add system message if this is the first message
-    if not conversation_history:
-        conversation_history.append({
-            "role": "system",
-            "content": "You are a helpful AI assistant with memory. You remember previous parts of the conversation and can reference them. Be friendly, helpful, and maintain context."
-        })
-    
-    # Add user message to history
+    # Add user message to history (the oldest message drops off when full)
     conversation_history.append({
         "role": "user",
         "content": user_message
     })
     
-    # Trim history to manage tokens (keep recent messages)
-    messages_to_send = trim_history(conversation_history, max_messages=20)
+    # The system message always goes first, followed by recent messages
+    messages_to_send = [SYSTEM_MESSAGE] + list(conversation_history)
     
-    # Get AI response
-    response = client.chat.completions.create(
+    # Get AI response, printing it piece by piece.
+    # Every request starts with the same SYSTEM_MESSAGE and earlier turns, so
+    # the prompt cache key lets the server reuse work on that shared prefix.
+    stream = client.chat.completions.create(
         model="gpt-3.5-turbo",
         messages=messages_to_send,
         temperature=0.7,
-        max_tokens=500
+        max_tokens=500,
+        stream=True,
+        extra_body={"prompt_cache_key": PROMPT_CACHE_KEY}
     )
     
-    assistant_message = response.choices[0].message.content
+    parts = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            print(delta, end="", flush=True)
+            parts.append(delta)
+    print()
+    
+    assistant_message = "".join(parts)
     
     # Add assistant response to history
     conversation_history.append({
@@ -174,11 +252,13 @@ def main():
     print("  - 'quit': Exit")
     print()
     
-    # Load existing conversation history
-    conversation_history = load_conversation_history()
+    # Load existing conversation history. The full history is kept for
+    # 'show memory'; only the recent window is sent to the AI.
+    full_history = load_conversation_history()
+    conversation_history = create_history_window(full_history)
     
-    if conversation_history:
-        print(f"📚 Loaded {len(conversation_history)} previous messages")
+    if full_history:
+        print(f"📚 Loaded {len(full_history)} previous messages")
         print("    (I remember our past conversations!)")
     else:
         print("📝 Starting a new conversation")
@@ -195,28 +275,28 @@ def main():
         
         # Handle special commands
         if user_input.lower() in ['quit', 'exit', 'q']:
-            # Save history before exiting
-            save_conversation_history(conversation_history)
             print("\n💾 Conversation saved. Goodbye!")
             break
         
         elif user_input.lower() == 'clear memory':
-            conversation_history = []
+            full_history = []
+            conversation_history = create_history_window()
             clear_conversation_history()
             continue
         
         elif user_input.lower() == 'show memory':
-            display_memory(conversation_history)
+            display_memory(full_history)
             continue
         
         # Get AI response with memory
         try:
             print("\nAI: ", end="", flush=True)
-            response = chat_with_memory(user_input, conversation_history)
-            print(response)
+            chat_with_memory(user_input, conversation_history)
             
-            # Save after each exchange
-            save_conversation_history(conversation_history)
+            # Save the new question and answer after each exchange
+            new_messages = [conversation_history[-2], conversation_history[-1]]
+            full_history.extend(new_messages)
+            append_messages(new_messages)
             
         except Exception as e:
             print(f"\n❌ Error: {e}")
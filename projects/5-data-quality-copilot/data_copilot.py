@@ -12,30 +12,113 @@ Key Features:
 """
 
 import os
+import glob
+import json
+import hashlib
+import argparse
+import importlib.util
+from functools import partial
+from multiprocessing import Pool
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
-from openai import OpenAI
+import numpy as np
 import pandas as pd
 
+# Polars is optional: it reads large CSV files much faster than pandas.
+# It is slow to import, so it's only loaded by the functions that use it.
+POLARS_AVAILABLE = importlib.util.find_spec("polars") is not None
+
+# Text that pandas reads as a missing value by default. Polars only treats
+# empty fields as missing, so it is given this list to count the same cells.
+MISSING_VALUE_STRINGS = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null"
+]
+
+# PyArrow is optional: it stores columns in the compact Arrow format
+# (text without one Python object per value, missing values as bitmaps)
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# The OpenAI client is created the first time it's needed (see get_client)
+client = None
+
+# Columns with at least this many values use the Numba outlier kernel (if installed)
+NUMBA_MIN_ROWS = 100_000
+
+# Sample values are looked for in this many leading rows first
+SAMPLE_WINDOW_ROWS = 1000
+
+# Files bigger than this are read in chunks instead of all at once
+STREAMING_MIN_BYTES = 1 << 30  # 1 GB
+CHUNK_ROWS = 1_000_000
+
+# For chunked files: quartiles come from a random sample of this many
+# values per column, and unique values are counted up to this limit
+QUARTILE_SAMPLE_SIZE = 100_000
+UNIQUE_COUNT_LIMIT = 100_000
+
+# Text columns longer than this get an estimated unique count,
+# measured on a random sample of UNIQUE_SAMPLE_ROWS values
+ESTIMATE_UNIQUE_MIN_ROWS = 200_000
+UNIQUE_SAMPLE_ROWS = 100_000
+
+# Finished reports are saved here so unchanged files aren't analyzed twice
+CACHE_DIR = Path(".cache")
+
+# Goes between the report and the AI recommendations in saved files
+REPORT_SEPARATOR = "\n\n" + "="*60 + "\nAI RECOMMENDATIONS\n" + "="*60 + "\n"
+
+# Shown instead of recommendations when the AI service can't be reached
+AI_UNAVAILABLE_MESSAGE = "AI recommendations are unavailable due to an error while contacting the AI service."
+
+# Shown instead of recommendations when the AI is turned off with --no-ai
+AI_SKIPPED_MESSAGE = "AI recommendations were skipped (--no-ai)."
 
 
 def load_csv_file(file_path):
     """
     Load a CSV file into a pandas DataFrame.
     
+    If Polars is installed, it reads the file instead of pandas: it parses
+    the CSV using all CPU cores, which is much faster for big files. It
+    is set up to treat the same text as missing as pandas does, and if it
+    can't read the file, pandas is tried instead.
+    
+    If PyArrow is installed, the columns are kept as Arrow arrays. Text
+    then takes about half the memory, and the missing-value and unique
+    checks run much faster than on columns of Python objects.
+    
     Args:
         file_path: Path to the CSV file
     
     Returns:
         pandas DataFrame or None if error
     """
+    if POLARS_AVAILABLE:
+        try:
+            import polars as pl
+            
+            # Polars guesses each column's type from the first 10,000 rows.
+            # Checking every row would be much slower, and if a column
+            # changes type later the read fails and pandas is used instead
+            pl_df = pl.read_csv(
+                file_path,
+                infer_schema_length=10000,
+                null_values=MISSING_VALUE_STRINGS
+            )
+            return pl_df.to_pandas(use_pyarrow_extension_array=PYARROW_AVAILABLE)
+        except Exception as e:
+            print(f"⚠️ Polars couldn't read {file_path}, using pandas instead: {e}")
+    
     try:
+        if PYARROW_AVAILABLE:
+            return pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow')
         df = pd.read_csv(file_path)
         return df
     except Exception as e:
@@ -43,37 +126,655 @@ def load_csv_file(file_path):
         return None
 
 
-def analyze_completeness(df):
+def quartiles(values):
     """
-    Check for missing values and completeness.
+    Find the first and third quartiles (Q1 and Q3) of some numbers.
+    
+    np.partition only puts the few values we need into their sorted
+    positions, which is much faster than sorting the whole column. The
+    result is the same as np.quantile (linear interpolation).
+    
+    Args:
+        values: numpy array of numbers with no missing values (not modified)
+    
+    Returns:
+        Tuple (Q1, Q3)
+    """
+    last = len(values) - 1
+    positions = [last * 0.25, last * 0.75]
+    lows = [int(position) for position in positions]
+    
+    # Each quartile sits between two neighbouring sorted values
+    wanted = sorted({index for low in lows for index in (low, min(low + 1, last))})
+    part = np.partition(values, wanted)
+    
+    result = []
+    for position, low in zip(positions, lows):
+        below = part[low]
+        above = part[min(low + 1, last)]
+        fraction = position - low
+        # Interpolate the same way NumPy does
+        if fraction >= 0.5:
+            result.append(above - (above - below) * (1 - fraction))
+        else:
+            result.append(below + (above - below) * fraction)
+    
+    return result[0], result[1]
+
+
+def count_outliers(values):
+    """
+    Count outliers in a column of numbers using the IQR method.
+    
+    Big columns use the compiled Numba kernel from data_copilot_numba.py
+    when Numba is installed; everything else uses NumPy.
+    
+    Args:
+        values: numpy array of numbers (missing values as NaN are skipped)
+    
+    Returns:
+        Tuple (count, lower_bound, upper_bound)
+    """
+    if len(values) >= NUMBA_MIN_ROWS:
+        # Numba is slow to import, so it's only loaded once a column is big
+        # enough to need it
+        from data_copilot_numba import NUMBA_AVAILABLE, iqr_outliers
+        if NUMBA_AVAILABLE:
+            # float32 columns stay float32, which halves the memory to scan
+            if values.dtype.kind != 'f':
+                values = values.astype(np.float64)
+            count, lower_bound, upper_bound = iqr_outliers(values)
+            return int(count), float(lower_bound), float(upper_bound)
+    
+    if values.dtype.kind == 'f':
+        values = values[~np.isnan(values)]
+    
+    if len(values) == 0:
+        return 0, float('nan'), float('nan')
+    
+    Q1, Q3 = quartiles(values)
+    IQR = Q3 - Q1
+    
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+    
+    num_outliers = int(((values < lower_bound) | (values > upper_bound)).sum())
+    return num_outliers, float(lower_bound), float(upper_bound)
+
+
+def is_number_column(dtype):
+    """
+    Check whether a column holds numbers that can have outliers.
+    
+    Covers every integer and float width (int32, float32, uint64, ...)
+    and pandas' nullable types (Int64, Float32, ...). Booleans don't count.
+    
+    Args:
+        dtype: Column data type
+    
+    Returns:
+        True for numeric columns
+    """
+    if isinstance(dtype, np.dtype):
+        return dtype.kind in 'iuf'
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def column_numbers(series):
+    """
+    Get a numeric column as a NumPy array for the outlier check.
+    
+    Plain NumPy columns are returned as they are (no copy). Nullable
+    columns mark missing values with pd.NA, which NumPy can't use, so
+    they are converted once to float64 with NaN for the missing values.
+    
+    Args:
+        series: pandas Series with a numeric type
+    
+    Returns:
+        numpy array
+    """
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def can_have_missing(series):
+    """
+    Check whether a column's type is able to store missing values.
+    
+    NumPy integer and boolean columns have no way to represent NaN, so
+    they never contain missing values and don't need to be checked.
+    
+    Args:
+        series: pandas Series
+    
+    Returns:
+        True unless the column is a plain NumPy int, uint or bool column
+    """
+    return not (isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iub')
+
+
+def count_duplicate_rows(df):
+    """
+    Count rows that are exact copies of an earlier row.
+    
+    Instead of comparing whole rows, each row is turned into one 64-bit
+    hash number (computed column by column in fast vectorized code), and
+    then only those numbers are compared. This is much faster and uses
+    far less memory than df.duplicated() on wide tables with text columns.
     
     Args:
         df: pandas DataFrame
     
+    Returns:
+        Number of duplicate rows
+    """
+    if len(df.columns) == 0:
+        return 0
+    
+    row_hashes = pd.util.hash_pandas_object(df, index=False)
+    return int(row_hashes.duplicated().sum())
+
+
+def first_values(series, count=3):
+    """
+    Get the first few non-missing values of a column.
+    
+    Only a small window at the top of the column is searched, so a big
+    column doesn't have to be copied just to show three examples. The
+    whole column is searched only if that window is mostly empty.
+    
+    Args:
+        series: pandas Series
+        count: Number of values to return
+    
+    Returns:
+        List of up to `count` values
+    """
+    window = series.head(SAMPLE_WINDOW_ROWS).dropna()
+    if len(window) < count and len(series) > SAMPLE_WINDOW_ROWS:
+        window = series.dropna()
+    return window.head(count).tolist()
+
+
+def count_unique(series, dtype):
+    """
+    Count the distinct non-missing values in a column.
+    
+    Long text columns often have a unique value in almost every row, and
+    counting them means hashing every string. For those, the count is
+    estimated from a random sample instead and marked as an estimate.
+    
+    The estimate uses the Chao1 formula: values seen exactly once in the
+    sample hint at how many values the sample missed entirely. If almost
+    every sampled value is different, the estimate grows towards the
+    number of non-missing rows (it never goes above it).
+    
+    Args:
+        series: pandas Series
+        dtype: The column's data type
+    
+    Returns:
+        Exact count (int), or a display string like "~98765 (est.)"
+    """
+    is_text = dtype == object or pd.api.types.is_string_dtype(dtype)
+    if is_text and len(series) > ESTIMATE_UNIQUE_MIN_ROWS:
+        non_missing_rows = int(series.count())
+        sample = series.sample(UNIQUE_SAMPLE_ROWS, random_state=0).dropna()
+        counts = sample.value_counts()
+        
+        # Values seen once and twice in the sample
+        seen_once = int((counts == 1).sum())
+        seen_twice = int((counts == 2).sum())
+        
+        estimate = len(counts) + seen_once * (seen_once - 1) / (2 * (seen_twice + 1))
+        estimate = min(round(estimate), non_missing_rows)
+        return f"~{estimate} (est.)"
+    
+    # nunique() only builds the set of distinct values. value_counts() would
+    # also count each one and build a result Series, which measured slower
+    # for every column type (and the sample values don't need it).
+    return series.nunique()
+
+
+def count_missing(series):
+    """
+    Count the missing values in a column.
+    
+    Plain integer and boolean columns can't hold missing values, so they
+    skip building the mask entirely.
+    
+    Args:
+        series: pandas Series
+    
+    Returns:
+        Number of missing values
+    """
+    if can_have_missing(series):
+        return int(series.isna().sum())
+    return 0
+
+
+def summarize_missing(missing_counts, num_rows, num_cells):
+    """
+    Turn per-column missing counts into the completeness results.
+    
+    Args:
+        missing_counts: Dictionary of column name -> number of missing values
+        num_rows: Number of rows in the data
+        num_cells: Number of cells (rows x columns)
+    
     Returns:
         Dictionary with completeness metrics
     """
-    total_cells = df.size
-    missing_cells = df.isnull().sum().sum()
-    missing_percentage = (missing_cells / total_cells) * 100 if total_cells > 0 else 0
+    total_missing = sum(missing_counts.values())
+    column_missing = {
+        col: {'count': count, 'percentage': round((count / num_rows) * 100, 2)}
+        for col, count in missing_counts.items()
+        if count > 0
+    }
+    return {
+        'total_missing': total_missing,
+        'missing_percentage': round((total_missing / num_cells) * 100, 2) if num_cells > 0 else 0,
+        'columns_with_missing': column_missing
+    }
+
+
+def describe_column(series, dtype):
+    """
+    Summarize a column's type, unique count and a few sample values.
+    
+    Unique counts skip missing values, and the samples come from the top
+    of the column only.
+    
+    Args:
+        series: pandas Series
+        dtype: The column's data type
+    
+    Returns:
+        Dictionary with 'type', 'unique_values' and 'sample_values'
+    """
+    return {
+        'type': str(dtype),
+        'unique_values': count_unique(series, dtype),
+        'sample_values': first_values(series)
+    }
+
+
+def find_outliers(numeric_columns, num_rows):
+    """
+    Check numeric columns for outliers, one column per thread.
+    
+    The outlier checks are independent for each column, and NumPy
+    releases Python's GIL while it partitions and compares numbers, so
+    the columns are checked in parallel threads.
+    
+    Args:
+        numeric_columns: List of (column name, pandas Series) pairs
+        num_rows: Number of rows in the data
+    
+    Returns:
+        Dictionary with outlier information for columns that have outliers
+    """
+    outliers = {}
+    if not numeric_columns:
+        return outliers
+    
+    workers = min(os.cpu_count() or 1, len(numeric_columns))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda series: count_outliers(column_numbers(series)),
+            [series for _, series in numeric_columns]
+        )
+        for (col, _), (num_outliers, lower_bound, upper_bound) in zip(numeric_columns, results):
+            if num_outliers > 0:
+                outliers[col] = {
+                    'count': num_outliers,
+                    'percentage': round((num_outliers / num_rows) * 100, 2),
+                    'range': f"{lower_bound:.2f} to {upper_bound:.2f}"
+                }
+    return outliers
+
+
+def run_quality_checks(df):
+    """
+    Run all quality checks in a single pass over the columns.
+    
+    Each column is read once, and that one pass produces its missing
+    count, type summary and outliers. Running the checks separately would
+    read every column several times, which is slow for big files.
+    
+    Args:
+        df: pandas DataFrame
+    
+    Returns:
+        Dictionary with 'completeness', 'duplicates', 'types' and 'outliers' results
+    """
+    missing_counts = {}
+    type_info = {}
+    numeric_columns = []
+    
+    # Look up every column's type once, up front
+    for col, dtype in df.dtypes.items():
+        series = df[col]
+        missing_counts[col] = count_missing(series)
+        type_info[col] = describe_column(series, dtype)
+        
+        # Numeric columns are checked for outliers below
+        if is_number_column(dtype):
+            numeric_columns.append((col, series))
+    
+    return {
+        'completeness': summarize_missing(missing_counts, len(df), df.size),
+        'duplicates': analyze_duplicates(df),
+        'types': type_info,
+        'outliers': find_outliers(numeric_columns, len(df)),
+        'shape': df.shape
+    }
+
+
+def polars_checks(df):
+    """
+    Count missing values and duplicate rows a second way, using Polars.
+    
+    This is an independent implementation used to double-check the
+    pandas results (see run_cross_checked_quality_checks).
+    
+    Args:
+        df: pandas DataFrame
+    
+    Returns:
+        Tuple (columns_with_missing, num_duplicates), where
+        columns_with_missing maps column names to missing counts
+    """
+    import polars as pl
+    
+    # from_pandas turns NaN into null, so both count the same cells
+    pl_df = pl.from_pandas(df)
+    missing_counts = pl_df.null_count().row(0)
+    columns_with_missing = {
+        col: count for col, count in zip(df.columns, missing_counts) if count > 0
+    }
+    num_duplicates = pl_df.height - pl_df.n_unique() if pl_df.width > 0 else 0
+    return columns_with_missing, num_duplicates
+
+
+def run_cross_checked_quality_checks(df):
+    """
+    Run the quality checks with pandas and Polars at the same time.
+    
+    Both run in parallel threads (Polars does its work outside Python,
+    so it doesn't slow pandas down). If the two disagree on missing
+    values or duplicates, a warning is printed, since that points to a bug.
+    
+    Args:
+        df: pandas DataFrame
+    
+    Returns:
+        Tuple of (results, cross_checked). The results are the pandas ones,
+        in the same format as run_quality_checks. cross_checked is False
+        if Polars couldn't run, so the results were not double-checked.
+    """
+    if not POLARS_AVAILABLE:
+        print("⚠️ Polars is not installed, skipping the cross-check.")
+        return run_quality_checks(df), False
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pandas_future = executor.submit(run_quality_checks, df)
+        polars_future = executor.submit(polars_checks, df)
+        results = pandas_future.result()
+        try:
+            columns_with_missing, num_duplicates = polars_future.result()
+        except Exception as e:
+            print(f"⚠️ Cross-check failed, using pandas results only: {e}")
+            return results, False
+    
+    pandas_missing = {
+        col: info['count'] for col, info in results['completeness']['columns_with_missing'].items()
+    }
+    if pandas_missing != columns_with_missing:
+        print(f"⚠️ Cross-check mismatch in missing values: pandas {pandas_missing}, polars {columns_with_missing}")
+    if results['duplicates']['count'] != num_duplicates:
+        print(f"⚠️ Cross-check mismatch in duplicates: pandas {results['duplicates']['count']}, polars {num_duplicates}")
+    
+    return results, True
+
+
+def read_csv_chunks(file_path, columns=None):
+    """
+    Read a CSV file piece by piece.
+    
+    Only one chunk of rows is in memory at a time, so files much bigger
+    than the computer's RAM can still be analyzed.
+    
+    Args:
+        file_path: Path to the CSV file
+        columns: Optional list of column names to read (default: all)
+    
+    Yields:
+        pandas DataFrames of up to CHUNK_ROWS rows
+    """
+    with pd.read_csv(file_path, usecols=columns, chunksize=CHUNK_ROWS) as reader:
+        yield from reader
+
+
+def combine_types(first, second):
+    """
+    Work out a column's overall type when chunks disagree.
+    
+    Each chunk guesses its own column types, so a column can be int64 in
+    one chunk and float64 in the next (e.g. once missing values appear).
+    
+    Args:
+        first: Type seen so far (or None)
+        second: Type of the column in the new chunk
+    
+    Returns:
+        A type that fits both: float64 for mixed numbers, object otherwise
+    """
+    if first is None or first == second:
+        return second
+    if is_number_column(first) and is_number_column(second):
+        return np.dtype('float64')
+    return np.dtype('object')
+
+
+def count_seen_hashes(seen_runs, hashes):
+    """
+    Count how many hashes were seen before, and remember the new ones.
+    
+    The hashes seen so far are kept as a few sorted NumPy arrays ("runs")
+    of uint64, which takes 8 bytes per distinct row (a Python set would
+    take several times that). Runs of similar size are merged, so there
+    are only about log2(rows) of them to search.
+    
+    Args:
+        seen_runs: List of sorted uint64 arrays (updated in place)
+        hashes: uint64 array of row hashes from one chunk
+    
+    Returns:
+        Number of hashes that are repeats (of this chunk or earlier ones)
+    """
+    new = np.unique(hashes)
+    repeats = len(hashes) - len(new)
+    
+    for run in seen_runs:
+        positions = np.searchsorted(run, new)
+        found = positions < len(run)
+        found[found] = run[positions[found]] == new[found]
+        repeats += int(found.sum())
+        new = new[~found]
+    
+    if len(new) > 0:
+        seen_runs.append(new)
+    while len(seen_runs) > 1 and len(seen_runs[-2]) <= 2 * len(seen_runs[-1]):
+        last = seen_runs.pop()
+        seen_runs[-1] = np.sort(np.concatenate([seen_runs[-1], last]))
+    
+    return repeats
+
+
+def update_column_stats(stats, series, rng):
+    """
+    Add one chunk of a column to its running statistics.
+    
+    Args:
+        stats: Dictionary of running statistics for the column
+        series: The column's values in this chunk
+        rng: numpy random Generator used to pick the quartile sample
+    """
+    stats['type'] = combine_types(stats['type'], series.dtype)
+    
+    non_missing = series.dropna()
+    stats['missing'] += len(series) - len(non_missing)
+    
+    if len(stats['samples']) < 3:
+        stats['samples'] += non_missing.head(3 - len(stats['samples'])).tolist()
+    
+    # Unique values are tracked as 64-bit hashes, and only up to a limit.
+    # Numbers are hashed as float64 so that 1 and 1.0 hash the same, even
+    # if one chunk reads the column as int64 and another as float64.
+    if stats['unique'] is not None:
+        if is_number_column(series.dtype):
+            non_missing = non_missing.astype(np.float64)
+        hashes = pd.util.hash_pandas_object(non_missing, index=False)
+        stats['unique'].update(pd.unique(hashes).tolist())
+        if len(stats['unique']) > UNIQUE_COUNT_LIMIT:
+            stats['unique'] = None
+    
+    # Keep a uniform random sample of the numbers for the quartiles: every
+    # value gets a random key, and the values with the smallest keys stay
+    if is_number_column(series.dtype):
+        values = column_numbers(non_missing)
+        keys = np.concatenate([stats['sample_keys'], rng.random(len(values))])
+        values = np.concatenate([stats['sample_values'], values.astype(np.float64)])
+        if len(keys) > QUARTILE_SAMPLE_SIZE:
+            keep = np.argpartition(keys, QUARTILE_SAMPLE_SIZE)[:QUARTILE_SAMPLE_SIZE]
+            keys, values = keys[keep], values[keep]
+        stats['sample_keys'], stats['sample_values'] = keys, values
+
+
+def run_streaming_checks(file_path):
+    """
+    Run all quality checks on a CSV file that is too big to load at once.
+    
+    The file is read twice, one chunk at a time:
+    1. Count missing values, duplicates and unique values, and collect a
+       random sample of each numeric column to estimate its quartiles.
+    2. Count the values outside each numeric column's expected range.
+    
+    Missing values and outlier counts are exact. Quartiles are estimated
+    from the sample, and duplicate rows are compared by hash. Memory use
+    grows by about 8 bytes per distinct row for the duplicate check.
     
+    Args:
+        file_path: Path to the CSV file
+    
+    Returns:
+        Dictionary in the same format as run_quality_checks
+    """
+    rng = np.random.default_rng(0)
+    num_rows = 0
+    num_duplicates = 0
+    seen_rows = []
+    column_stats = {}
+    
+    # Pass 1: missing values, duplicates, types and quartile samples
+    for chunk in read_csv_chunks(file_path):
+        num_rows += len(chunk)
+        
+        # Numbers are hashed as float64, so a row hashes the same way even
+        # if chunks guess different number types for a column
+        as_float = {col: np.float64 for col, dtype in chunk.dtypes.items() if is_number_column(dtype)}
+        row_hashes = pd.util.hash_pandas_object(chunk.astype(as_float), index=False)
+        num_duplicates += count_seen_hashes(seen_rows, row_hashes.to_numpy())
+        
+        for col in chunk.columns:
+            if col not in column_stats:
+                column_stats[col] = {
+                    'type': None,
+                    'missing': 0,
+                    'samples': [],
+                    'unique': set(),
+                    'sample_keys': np.empty(0),
+                    'sample_values': np.empty(0)
+                }
+            update_column_stats(column_stats[col], chunk[col], rng)
+    
+    # Expected range of each numeric column, from its sample's quartiles
+    bounds = {}
+    for col, stats in column_stats.items():
+        if is_number_column(stats['type']) and len(stats['sample_values']) > 0:
+            Q1, Q3 = quartiles(stats['sample_values'])
+            IQR = Q3 - Q1
+            bounds[col] = (Q1 - 1.5 * IQR, Q3 + 1.5 * IQR)
+    
+    # Pass 2: count outliers (only the numeric columns are read)
+    outlier_counts = dict.fromkeys(bounds, 0)
+    if bounds:
+        for chunk in read_csv_chunks(file_path, columns=list(bounds)):
+            for col, (lower_bound, upper_bound) in bounds.items():
+                values = column_numbers(chunk[col])
+                outlier_counts[col] += int(((values < lower_bound) | (values > upper_bound)).sum())
+    
+    # Put the results in the same format as run_quality_checks
+    num_cells = num_rows * len(column_stats)
+    total_missing = sum(stats['missing'] for stats in column_stats.values())
     column_missing = {}
-    for col in df.columns:
-        missing = df[col].isnull().sum()
-        if missing > 0:
-            missing_pct = (missing / len(df)) * 100 if len(df) > 0 else 0
+    type_info = {}
+    for col, stats in column_stats.items():
+        if stats['missing'] > 0:
             column_missing[col] = {
-                'count': missing,
-                'percentage': round(missing_pct, 2)
+                'count': stats['missing'],
+                'percentage': round((stats['missing'] / num_rows) * 100, 2)
+            }
+        type_info[col] = {
+            'type': str(stats['type']),
+            'unique_values': len(stats['unique']) if stats['unique'] is not None else f"more than {UNIQUE_COUNT_LIMIT:,}",
+            'sample_values': stats['samples']
+        }
+    
+    outliers = {}
+    for col, count in outlier_counts.items():
+        if count > 0:
+            lower_bound, upper_bound = bounds[col]
+            outliers[col] = {
+                'count': count,
+                'percentage': round((count / num_rows) * 100, 2),
+                'range': f"{lower_bound:.2f} to {upper_bound:.2f}"
             }
     
     return {
-        'total_missing': missing_cells,
-        'missing_percentage': round(missing_percentage, 2),
-        'columns_with_missing': column_missing
+        'completeness': {
+            'total_missing': total_missing,
+            'missing_percentage': round((total_missing / num_cells) * 100, 2) if num_cells > 0 else 0,
+            'columns_with_missing': column_missing
+        },
+        'duplicates': {
+            'count': num_duplicates,
+            'percentage': round((num_duplicates / num_rows) * 100, 2) if num_rows > 0 else 0
+        },
+        'types': type_info,
+        'outliers': outliers,
+        'shape': (num_rows, len(column_stats))
     }
 
 
+def analyze_completeness(df):
+    """
+    Check for missing values and completeness.
+    
+    Args:
+        df: pandas DataFrame
+    
+    Returns:
+        Dictionary with completeness metrics
+    """
+    missing_counts = {col: count_missing(df[col]) for col in df.columns}
+    return summarize_missing(missing_counts, len(df), df.size)
+
+
 def analyze_duplicates(df):
     """
     Check for duplicate records.
@@ -84,13 +785,10 @@ def analyze_duplicates(df):
     Returns:
         Dictionary with duplicate information
     """
-    duplicates = df.duplicated()
-    num_duplicates = duplicates.sum()
-    duplicate_percentage = (num_duplicates / len(df)) * 100 if len(df) > 0 else 0
-    
+    num_duplicates = count_duplicate_rows(df)
     return {
         'count': num_duplicates,
-        'percentage': round(duplicate_percentage, 2)
+        'percentage': round((num_duplicates / len(df)) * 100, 2) if len(df) > 0 else 0
     }
 
 
@@ -104,19 +802,7 @@ def analyze_data_types(df):
     Returns:
         Dictionary with data type information
     """
-    type_info = {}
-    
-    for col in df.columns:
-        col_type = str(df[col].dtype)
-        unique_count = df[col].nunique()
-        
-        type_info[col] = {
-            'type': col_type,
-            'unique_values': unique_count,
-            'sample_values': df[col].dropna().head(3).tolist()
-        }
-    
-    return type_info
+    return {col: describe_column(df[col], dtype) for col, dtype in df.dtypes.items()}
 
 
 def analyze_outliers(df):
@@ -129,40 +815,19 @@ def analyze_outliers(df):
     Returns:
         Dictionary with outlier information
     """
-    outliers = {}
-    
-    # Get numeric columns
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
-    
-    for col in numeric_cols:
-        # Use IQR method to detect outliers
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-        
-        outlier_mask = (df[col] < lower_bound) | (df[col] > upper_bound)
-        num_outliers = outlier_mask.sum()
-        
-        if num_outliers > 0:
-            outliers[col] = {
-                'count': num_outliers,
-                'percentage': round((num_outliers / len(df)) * 100, 2) if len(df) > 0 else 0,
-                'range': f"{lower_bound:.2f} to {upper_bound:.2f}"
-            }
-    
-    return outliers
+    numeric_columns = [
+        (col, df[col]) for col, dtype in df.dtypes.items() if is_number_column(dtype)
+    ]
+    return find_outliers(numeric_columns, len(df))
 
 
-def create_quality_report(file_name, df, completeness, duplicates, types, outliers):
+def create_quality_report(file_name, shape, completeness, duplicates, types, outliers):
     """
     Create a text summary of data quality findings.
     
     Args:
         file_name: Name of the file
-        df: DataFrame
+        shape: Tuple (rows, columns) of the data
         completeness: Completeness analysis results
         duplicates: Duplicate analysis results
         types: Data type analysis results
@@ -171,72 +836,109 @@ def create_quality_report(file_name, df, completeness, duplicates, types, outlie
     Returns:
         Formatted report string
     """
-    report = f"""
+    num_rows, num_columns = shape
+    
+    # Collect the pieces in a list and join them once at the end. Adding
+    # to a string with += copies the whole report every time, which gets
+    # slow for files with thousands of columns.
+    parts = [f"""
 DATA QUALITY REPORT
 {'='*60}
 
 File: {file_name}
-Rows: {len(df)}
-Columns: {len(df.columns)}
-Total Data Points: {df.size}
+Rows: {num_rows}
+Columns: {num_columns}
+Total Data Points: {num_rows * num_columns}
 
 COMPLETENESS ANALYSIS
 {'-'*60}
 Missing Data: {completeness['total_missing']} cells ({completeness['missing_percentage']}%)
-"""
+"""]
     
     if completeness['columns_with_missing']:
-        report += "\nColumns with Missing Values:\n"
-        for col, info in completeness['columns_with_missing'].items():
-            report += f"  • {col}: {info['count']} missing ({info['percentage']}%)\n"
+        parts.append("\nColumns with Missing Values:\n")
+        parts.extend(
+            f"  • {col}: {info['count']} missing ({info['percentage']}%)\n"
+            for col, info in completeness['columns_with_missing'].items()
+        )
     else:
-        report += "✅ No missing values detected\n"
+        parts.append("✅ No missing values detected\n")
     
-    report += f"""
+    parts.append(f"""
 DUPLICATE ANALYSIS
 {'-'*60}
 Duplicate Rows: {duplicates['count']} ({duplicates['percentage']}%)
-"""
+""")
     
     if duplicates['count'] > 0:
-        report += "⚠️  Consider removing duplicates\n"
+        parts.append("⚠️  Consider removing duplicates\n")
     else:
-        report += "✅ No duplicates found\n"
+        parts.append("✅ No duplicates found\n")
     
-    report += f"""
+    parts.append(f"""
 DATA TYPE SUMMARY
 {'-'*60}
-"""
-    for col, info in types.items():
-        report += f"{col}:\n"
-        report += f"  Type: {info['type']}\n"
-        report += f"  Unique values: {info['unique_values']}\n"
+""")
+    parts.extend(
+        f"{col}:\n  Type: {info['type']}\n  Unique values: {info['unique_values']}\n"
+        for col, info in types.items()
+    )
     
     if outliers:
-        report += f"""
+        parts.append(f"""
 OUTLIER DETECTION
 {'-'*60}
-"""
-        for col, info in outliers.items():
-            report += f"{col}:\n"
-            report += f"  Outliers: {info['count']} ({info['percentage']}%)\n"
-            report += f"  Expected range: {info['range']}\n"
+""")
+        parts.extend(
+            f"{col}:\n  Outliers: {info['count']} ({info['percentage']}%)\n  Expected range: {info['range']}\n"
+            for col, info in outliers.items()
+        )
     else:
-        report += f"""
+        parts.append(f"""
 OUTLIER DETECTION
 {'-'*60}
 ✅ No significant outliers detected in numeric columns
-"""
+""")
     
-    return report
+    return "".join(parts)
 
 
-def get_ai_recommendations(report):
+def get_client():
+    """
+    Get the OpenAI client, creating it the first time it's needed.
+    
+    The openai library takes a moment to import, so it is only loaded
+    when AI recommendations are actually requested. Runs that end early
+    (no CSV files, 'quit', or a saved report being reused) skip it.
+    
+    Returns:
+        OpenAI client
+    """
+    global client
+    if client is None:
+        import httpx
+        from openai import OpenAI
+        
+        # One shared HTTP client keeps connections open between requests, so
+        # repeated calls skip the connection and TLS setup.
+        http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=60.0
+        )
+        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
+    return client
+
+
+def get_ai_recommendations(report, stream=False):
     """
     Get AI-powered recommendations based on the quality report.
     
+    With stream=True the answer is printed piece by piece as it arrives,
+    so the user can start reading while the rest is still being written.
+    
     Args:
         report: Text quality report
+        stream: If True, print the recommendations while they arrive
     
     Returns:
         AI-generated recommendations
@@ -253,17 +955,31 @@ Please provide:
 
 Keep recommendations clear and practical."""
     
-    response = client.chat.completions.create(
+    response = get_client().chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[
             {"role": "system", "content": "You are a data quality expert helping beginners improve their data. Provide clear, actionable advice."},
             {"role": "user", "content": prompt}
         ],
         temperature=0.7,
-        max_tokens=600
+        max_tokens=600,
+        stream=stream
     )
     
-    return response.choices[0].message.content
+    if not stream:
+        return response.choices[0].message.content
+    
+    parts = []
+    for chunk in response:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            print(delta, end="", flush=True)
+            parts.append(delta)
+    print()
+    
+    return "".join(parts)
 
 
 def save_report(report, recommendations, file_name):
@@ -276,24 +992,308 @@ def save_report(report, recommendations, file_name):
         file_name: Original file name
     """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"quality_report_{timestamp}.txt"
+    # Include the data file's name so batch runs don't overwrite each other
+    output_file = f"quality_report_{Path(file_name).stem}_{timestamp}.txt"
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(report)
-        f.write("\n\n")
-        f.write("="*60)
-        f.write("\nAI RECOMMENDATIONS\n")
-        f.write("="*60)
-        f.write("\n")
-        f.write(recommendations)
+    # Write everything in one go
+    Path(output_file).write_text(report + REPORT_SEPARATOR + recommendations, encoding='utf-8')
     
     print(f"\n📄 Full report saved to: {output_file}")
 
 
+def get_recommendations_or_fallback(report, stream=False):
+    """
+    Get AI recommendations, or a short notice if the AI service fails.
+    
+    Args:
+        report: Text quality report
+        stream: If True, print the recommendations while they arrive
+    
+    Returns:
+        Recommendations text
+    """
+    try:
+        return get_ai_recommendations(report, stream=stream)
+    except Exception as e:
+        print(f"⚠️ Failed to get AI recommendations: {e}")
+        return AI_UNAVAILABLE_MESSAGE
+
+
+def get_cache_path(file_path):
+    """
+    Find where the saved results for a CSV file live.
+    
+    The cache file is named after a BLAKE2b hash of the file's name and
+    contents, so any edit to the file gives it a new cache entry. (The
+    name is included because it appears in the report.)
+    
+    Args:
+        file_path: Path to the CSV file
+    
+    Returns:
+        Path of the JSON cache file (it may not exist yet)
+    """
+    digest = hashlib.blake2b(Path(file_path).name.encode("utf-8"))
+    
+    # Read in 1 MB blocks so huge files don't have to fit in memory
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    
+    return CACHE_DIR / f"quality_{digest.hexdigest()}.json"
+
+
+def load_cached_results(cache_path, cross_check=False):
+    """
+    Load saved results for a file that was analyzed before.
+    
+    Args:
+        cache_path: Path returned by get_cache_path
+        cross_check: If True, only accept results that were cross-checked
+                     with Polars (so the check isn't silently skipped)
+    
+    Returns:
+        Dictionary with 'report', 'recommendations' (which may be None) and
+        'cross_checked', or an empty dictionary if nothing usable is saved
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cross_check and not cached.get('cross_checked'):
+        return {}
+    return cached
+
+
+def save_cached_results(cache_path, report, recommendations, cross_checked=False):
+    """
+    Save a report and its recommendations for the next run.
+    
+    The "AI unavailable" and "AI skipped" notices are not saved, so the
+    next run asks the AI again instead of reusing them.
+    
+    Args:
+        cache_path: Path returned by get_cache_path
+        report: Text quality report
+        recommendations: AI recommendations text
+        cross_checked: Whether the report was cross-checked with Polars
+    """
+    if recommendations in (AI_UNAVAILABLE_MESSAGE, AI_SKIPPED_MESSAGE):
+        recommendations = None
+    
+    CACHE_DIR.mkdir(exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'report': report,
+            'recommendations': recommendations,
+            'cross_checked': cross_checked
+        }, f)
+
+
+def build_report(file_path, cross_check=False):
+    """
+    Load a CSV file, run the quality checks, and build the text report.
+    
+    Files over STREAMING_MIN_BYTES are read in chunks so they never have
+    to fit in memory; smaller files are loaded whole.
+    
+    Args:
+        file_path: Path to the CSV file
+        cross_check: If True, double-check loaded files with Polars
+    
+    Returns:
+        Tuple of (report, cross_checked), where cross_checked tells if the
+        Polars cross-check actually ran. The report is None if the file
+        couldn't be loaded.
+    """
+    cross_checked = False
+    if Path(file_path).stat().st_size > STREAMING_MIN_BYTES:
+        # The cross-check needs the whole file in memory, so it can't run here
+        if cross_check:
+            print("⚠️ --cross-check is skipped for files read in chunks.")
+        try:
+            results = run_streaming_checks(file_path)
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+            return None, False
+    else:
+        df = load_csv_file(file_path)
+        if df is None:
+            return None, False
+        if cross_check:
+            results, cross_checked = run_cross_checked_quality_checks(df)
+        else:
+            results = run_quality_checks(df)
+    
+    report = create_quality_report(
+        Path(file_path).name,
+        results['shape'],
+        results['completeness'],
+        results['duplicates'],
+        results['types'],
+        results['outliers']
+    )
+    return report, cross_checked
+
+
+def analyze_one(file_path, cross_check=False, use_ai=True):
+    """
+    Run the full pipeline for one CSV file: load, check, report, recommend.
+    
+    Args:
+        file_path: Path to the CSV file
+        cross_check: If True, double-check the results with Polars
+        use_ai: If False, skip the AI recommendations (unless already saved)
+    
+    Returns:
+        Tuple (report, recommendations), or (None, None) if the file couldn't
+        be analyzed
+    """
+    # In batch mode one broken file must not stop the others, so any error
+    # is reported here and the file is skipped
+    try:
+        # Reuse the results from an earlier run if the file hasn't changed
+        cache_path = get_cache_path(file_path)
+        # With --cross-check, only results that were cross-checked are reused
+        cached = load_cached_results(cache_path, cross_check)
+        if cached.get('report') and cached.get('recommendations'):
+            return cached['report'], cached['recommendations']
+        
+        if cached.get('report'):
+            report = cached['report']
+            cross_checked = cached.get('cross_checked', False)
+        else:
+            report, cross_checked = build_report(file_path, cross_check)
+            if report is None:
+                return None, None
+        
+        if use_ai:
+            recommendations = get_recommendations_or_fallback(report)
+        else:
+            recommendations = AI_SKIPPED_MESSAGE
+        save_cached_results(cache_path, report, recommendations, cross_checked)
+        return report, recommendations
+    except Exception as e:
+        print(f"Error analyzing {file_path}: {e}")
+        return None, None
+
+
+def run_batch(file_paths, jobs=None, cross_check=False, use_ai=True):
+    """
+    Analyze many CSV files at once, spread over several worker processes.
+    
+    Each file is independent, so the files are spread over several
+    processes and analyzed in parallel (AI requests overlap too).
+    
+    Args:
+        file_paths: List of CSV file paths
+        jobs: Number of worker processes (default: one per CPU core)
+        cross_check: If True, double-check the results with Polars
+        use_ai: If False, skip the AI recommendations
+    """
+    processes = min(jobs or os.cpu_count() or 1, len(file_paths))
+    print(f"🔍 Analyzing {len(file_paths)} file(s) using {processes} process(es)...")
+    
+    analyze = partial(analyze_one, cross_check=cross_check, use_ai=use_ai)
+    if processes > 1:
+        with Pool(processes=processes) as pool:
+            results = pool.map(analyze, file_paths)
+    else:
+        # A single worker doesn't need the cost of starting a process
+        results = [analyze(file_path) for file_path in file_paths]
+    
+    for file_path, (report, recommendations) in zip(file_paths, results):
+        if report is None:
+            print(f"\n❌ Skipped {Path(file_path).name} (could not be analyzed)")
+            continue
+        save_report(report, recommendations, Path(file_path).name)
+
+
+def analyze_and_show(file_path, cross_check=False, use_ai=True):
+    """
+    Analyze one CSV file, print the report and recommendations, and save them.
+    
+    Args:
+        file_path: Path to the CSV file
+        cross_check: If True, double-check the results with Polars
+        use_ai: If False, skip the AI recommendations (unless already saved)
+    """
+    file_path = Path(file_path)
+    print(f"\n🔍 Analyzing {file_path.name}...\n")
+    
+    # Reuse the results from an earlier run if the file hasn't changed
+    cache_path = get_cache_path(file_path)
+    # With --cross-check, only results that were cross-checked are reused
+    cached = load_cached_results(cache_path, cross_check)
+    
+    if cached.get('report'):
+        print("♻️ File unchanged since the last run, reusing the saved report.")
+        report = cached['report']
+        cross_checked = cached.get('cross_checked', False)
+    else:
+        print("Running quality checks...")
+        report, cross_checked = build_report(file_path, cross_check)
+        if report is None:
+            return
+    
+    # Display report
+    print(report)
+    
+    # Get AI recommendations (new ones are shown while they arrive)
+    recommendations = cached.get('recommendations')
+    if not recommendations and use_ai:
+        print("\n💭 Getting AI recommendations...")
+    
+    print("\n" + "="*60)
+    print("AI RECOMMENDATIONS")
+    print("="*60)
+    
+    if recommendations:
+        print(recommendations)
+    else:
+        if use_ai:
+            recommendations = get_recommendations_or_fallback(report, stream=True)
+        else:
+            recommendations = AI_SKIPPED_MESSAGE
+        if recommendations in (AI_UNAVAILABLE_MESSAGE, AI_SKIPPED_MESSAGE):
+            print(recommendations)
+        save_cached_results(cache_path, report, recommendations, cross_checked)
+    
+    # Save report
+    save_report(report, recommendations, file_path.name)
+
+
 def main():
     """
     Main function to run the data quality copilot.
+    
+    Without options, it lists the CSV files in the data folder and asks
+    which one to analyze. The options let it run unattended, e.g. from
+    a script: --file analyzes one file, --batch analyzes every match.
     """
+    parser = argparse.ArgumentParser(description="AI-powered data quality analysis for CSV files")
+    parser.add_argument("--file",
+                        help="analyze this CSV file without asking")
+    parser.add_argument("--glob", default="data/*.csv",
+                        help="which CSV files to list or analyze (default: data/*.csv)")
+    parser.add_argument("--batch", action="store_true",
+                        help="analyze every matching CSV file in parallel")
+    parser.add_argument("--jobs", type=int,
+                        help="number of worker processes for --batch (default: one per CPU core)")
+    parser.add_argument("--no-ai", action="store_true",
+                        help="skip the AI recommendations (no API calls)")
+    parser.add_argument("--cross-check", action="store_true",
+                        help="double-check missing values and duplicates with Polars")
+    args = parser.parse_args()
+    if args.jobs is not None:
+        if args.jobs < 1:
+            parser.error("--jobs must be at least 1")
+        if not args.batch:
+            parser.error("--jobs only applies to --batch")
+    use_ai = not args.no_ai
+    
     print("=" * 60)
     print("Data Quality Copilot")
     print("=" * 60)
@@ -301,18 +1301,29 @@ def main():
     print("AI-powered data quality analysis for your CSV files")
     print()
     
+    if args.file:
+        if not Path(args.file).is_file():
+            print(f"File not found: {args.file}")
+            return
+        analyze_and_show(args.file, args.cross_check, use_ai)
+        return
+    
     # Create data directory if it doesn't exist
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)
     
     # Find CSV files
-    csv_files = list(data_dir.glob("*.csv"))
+    csv_files = sorted(Path(path) for path in glob.glob(args.glob))
     
     if not csv_files:
-        print("No CSV files found in the 'data' folder.")
+        print(f"No CSV files found matching '{args.glob}'.")
         print("Please add CSV files to analyze.")
         return
     
+    if args.batch:
+        run_batch(csv_files, args.jobs, args.cross_check, use_ai)
+        return
+    
     print(f"Found {len(csv_files)} CSV file(s):\n")
     for i, file_path in enumerate(csv_files, 1):
         print(f"{i}. {file_path.name}")
@@ -330,49 +1341,7 @@ def main():
         print("Invalid selection.")
         return
     
-    print(f"\n🔍 Analyzing {selected_file.name}...\n")
-    
-    # Load the data
-    df = load_csv_file(selected_file)
-    
-    if df is None:
-        return
-    
-    # Perform analyses
-    print("Running quality checks...")
-    completeness = analyze_completeness(df)
-    duplicates = analyze_duplicates(df)
-    types = analyze_data_types(df)
-    outliers = analyze_outliers(df)
-    
-    # Create report
-    report = create_quality_report(
-        selected_file.name,
-        df,
-        completeness,
-        duplicates,
-        types,
-        outliers
-    )
-    
-    # Display report
-    print(report)
-    
-    # Get AI recommendations
-    print("\n💭 Getting AI recommendations...")
-    try:
-        recommendations = get_ai_recommendations(report)
-    except Exception as e:
-        print(f"⚠️ Failed to get AI recommendations: {e}")
-        recommendations = "AI recommendations are unavailable due to an error while contacting the AI service."
-    
-    print("\n" + "="*60)
-    print("AI RECOMMENDATIONS")
-    print("="*60)
-    print(recommendations)
-    
-    # Save report
-    save_report(report, recommendations, selected_file.name)
+    analyze_and_show(selected_file, args.cross_check, use_ai)
 
 
 if __name__ == "__main__":